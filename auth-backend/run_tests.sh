@@ -2,6 +2,8 @@
 
 # Test runner script for auth-backend
 # This script installs test dependencies and runs the test suite
+# Usage: ./run_tests.sh [--fast]
+#   --fast  Skip installation and run only the service account unit tests with plugin autoloading disabled
 
 set -e  # Exit on any error
 
@@ -13,6 +15,16 @@ if [ ! -f "requirements-test.txt" ]; then
     exit 1
 fi
 
+# Fast loop: load only pytest-asyncio and clear addopts, which reference the xdist and coverage plugins.
+# Cache writes and stepwise are skipped here only, so --lf/--ff/--sw keep working in regular runs.
+if [ "$1" = "--fast" ]; then
+    echo "⚡ Running service account unit tests without plugin autoloading..."
+    PYTEST_DISABLE_PLUGIN_AUTOLOAD=1 python3 -m pytest -p pytest_asyncio.plugin -o addopts="" -q \
+        -p no:cacheprovider -p no:stepwise \
+        tests/unit/services/test_service_account_service.py
+    exit 0
+fi
+
 # Install dependencies using pip
 echo "📦 Installing dependencies with pip..."
 if command -v python3 &> /dev/null; then
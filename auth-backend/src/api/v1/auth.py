@@ -11,12 +11,11 @@ from ...core.database import get_db
 from ...repositories.audit_log import AuditLogRepository
 from ...repositories.role import RoleRepository
 from ...repositories.user import UserRepository
-from ...services.hydra_client import HydraAdminClient
+from ...services.hydra_client import HydraAdminClient, get_hydra_admin_client
 from ...services.user_service import UserService
 
 router = APIRouter()
 templates = Jinja2Templates(directory="src/templates")
-hydra_client = HydraAdminClient()
 
 
 async def get_user_service(db: AsyncSession = Depends(get_db)) -> UserService:
@@ -36,6 +35,7 @@ async def login_page(
     login_challenge: str = Query(...),
     error: Optional[str] = Query(None),
     email: Optional[str] = Query(None),
+    hydra_client: HydraAdminClient = Depends(get_hydra_admin_client),
 ):
     """Display the login page."""
     try:
@@ -81,6 +81,7 @@ async def login_submit(
     password: str = Form(...),
     remember: Optional[bool] = Form(False),
     user_service: UserService = Depends(get_user_service),
+    hydra_client: HydraAdminClient = Depends(get_hydra_admin_client),
 ):
     """Handle login form submission."""
     try:
@@ -126,7 +127,11 @@ async def login_submit(
 
 
 @router.get("/consent", response_class=HTMLResponse)
-async def consent_page(request: Request, consent_challenge: str = Query(...)):
+async def consent_page(
+    request: Request,
+    consent_challenge: str = Query(...),
+    hydra_client: HydraAdminClient = Depends(get_hydra_admin_client),
+):
     """Display the consent page."""
     try:
         # Get consent request info from Hydra
@@ -158,7 +163,12 @@ async def consent_page(request: Request, consent_challenge: str = Query(...)):
 
 
 @router.post("/consent")
-async def consent_submit(request: Request, consent_challenge: str = Form(...), action: str = Form(...)):
+async def consent_submit(
+    request: Request,
+    consent_challenge: str = Form(...),
+    action: str = Form(...),
+    hydra_client: HydraAdminClient = Depends(get_hydra_admin_client),
+):
     """Handle consent form submission."""
     try:
         # Get consent request info from Hydra
@@ -207,7 +217,11 @@ async def consent_submit(request: Request, consent_challenge: str = Form(...), a
 
 
 @router.get("/logout", response_class=HTMLResponse)
-async def logout_page(request: Request, logout_challenge: str = Query(...)):
+async def logout_page(
+    request: Request,
+    logout_challenge: str = Query(...),
+    hydra_client: HydraAdminClient = Depends(get_hydra_admin_client),
+):
     """Display the logout page."""
     try:
         # Get logout request info from Hydra
@@ -229,7 +243,12 @@ async def logout_page(request: Request, logout_challenge: str = Query(...)):
 
 
 @router.post("/logout")
-async def logout_submit(request: Request, logout_challenge: str = Form(...), action: str = Form(...)):
+async def logout_submit(
+    request: Request,
+    logout_challenge: str = Form(...),
+    action: str = Form(...),
+    hydra_client: HydraAdminClient = Depends(get_hydra_admin_client),
+):
     """Handle logout form submission."""
     try:
         if action == "accept":
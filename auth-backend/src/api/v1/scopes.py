@@ -23,7 +23,7 @@ from ...schemas.scope import (
     ScopeResponse,
     ScopeUpdate,
 )
-from ...services.hydra_client import HydraAdminClient
+from ...services.hydra_client import get_hydra_admin_client
 from ...services.scope_service import ScopeService
 
 router = APIRouter(prefix="/scopes")
@@ -31,7 +31,7 @@ router = APIRouter(prefix="/scopes")
 
 def get_scope_service(db: AsyncSession = Depends(get_db)) -> ScopeService:
     """Get scope service instance."""
-    hydra_client = HydraAdminClient()
+    hydra_client = get_hydra_admin_client()
     return ScopeService(db, hydra_client)
 
 
@@ -33,7 +33,7 @@ from ...schemas.service_account import (
     ServiceAccountResponse,
     ServiceAccountUpdate,
 )
-from ...services.hydra_client import HydraAdminClient
+from ...services.hydra_client import get_hydra_admin_client
 from ...services.service_account_service import ServiceAccountService
 
 logger = logging.getLogger(__name__)
@@ -114,7 +114,7 @@ async def get_service_account_service(db: AsyncSession = Depends(get_db)) -> Ser
     """Dependency to get service account service."""
     service_account_repo = ServiceAccountRepository(db)
     role_repo = RoleRepository(db)
-    hydra_client = HydraAdminClient()
+    hydra_client = get_hydra_admin_client()
     return ServiceAccountService(service_account_repo, role_repo, hydra_client)
 
 
@@ -51,9 +51,9 @@ async def hydra_status():
         dict: Hydra health status
     """
     try:
-        from ...services.hydra_client import HydraAdminClient
+        from ...services.hydra_client import get_hydra_admin_client
 
-        hydra_client = HydraAdminClient()
+        hydra_client = get_hydra_admin_client()
         is_healthy = await hydra_client.health_check()
 
         return {"hydra_connected": is_healthy, "status": "healthy" if is_healthy else "unhealthy"}
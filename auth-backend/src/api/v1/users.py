@@ -2,14 +2,14 @@
 
 from typing import List
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ...core.database import get_db
 from ...middleware.auth import get_current_user
 from ...repositories.audit_log import AuditLogRepository
 from ...repositories.role import RoleRepository
-from ...repositories.user import UserRepository
+from ...repositories.user import MAX_PAGE_SIZE, UserRepository
 from ...schemas.audit import AuditLogResponse
 from ...schemas.common import SuccessResponse
 from ...schemas.user import UserCreate, UserPasswordReset, UserResponse, UserUpdate
@@ -29,7 +29,7 @@ def get_user_service(db: AsyncSession = Depends(get_db)) -> UserService:
 @router.get("/users", response_model=List[UserResponse])
 async def get_users(
     skip: int = 0,
-    limit: int = 100,
+    limit: int = Query(100, le=MAX_PAGE_SIZE),
     user_service: UserService = Depends(get_user_service),
     current_user: dict = Depends(get_current_user),
 ):
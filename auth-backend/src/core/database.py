@@ -31,6 +31,8 @@ async_engine = create_async_engine(
     echo=settings.environment == "development",
     pool_pre_ping=True,
     pool_recycle=300,
+    # Repositories issue a wide fan-out of statement shapes; keep them all in the compiled cache
+    query_cache_size=1200,
 )
 
 # Create async session maker
@@ -77,7 +79,7 @@ async def initialize_default_data() -> None:
     from ..models.audit_log import AuditLog
     from ..models.role import Role
     from ..models.user import User
-    from ..services.auth_service import AuthService
+    from ..services.auth_service import get_auth_service
 
     async with AsyncSessionLocal() as session:
         try:
@@ -108,8 +110,7 @@ async def initialize_default_data() -> None:
 
             if not admin_user:
                 # Create default admin user
-                auth_service = AuthService()
-                hashed_password = auth_service.hash_password(settings.default_admin_password)
+                hashed_password = await get_auth_service().hash_password_async(settings.default_admin_password)
 
                 admin_user = User(
                     email=settings.default_admin_email,
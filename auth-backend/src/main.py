@@ -5,6 +5,8 @@ This service handles authentication and authorization for the OAuth2 system.
 It integrates with Ory Hydra and provides user/service/role management.
 """
 
+import asyncio
+import signal
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 
@@ -27,6 +29,8 @@ from .core.database import create_tables, initialize_default_data
 from .core.exceptions import setup_exception_handlers
 from .core.logging_config import setup_logging
 from .core.rate_limiting import limiter
+from .services.admin_service import clear_jwt_public_key_cache
+from .services.hydra_client import get_hydra_admin_client
 
 
 @asynccontextmanager
@@ -41,6 +45,12 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     logger = structlog.get_logger()
     setup_logging()
 
+    # Reload the cached JWT public key on SIGHUP (key rotation without restart)
+    try:
+        asyncio.get_running_loop().add_signal_handler(signal.SIGHUP, clear_jwt_public_key_cache)
+    except (AttributeError, NotImplementedError, RuntimeError):
+        logger.warning("SIGHUP handler not supported; JWT public key cache will not auto-reload")
+
     # Try to initialize database, but don't fail if database is not available
     try:
         await create_tables()
@@ -72,8 +82,9 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
 
     yield
 
-    # Shutdown
-    pass
+    # Shutdown: drop the closed client so a later lifespan in this process builds a fresh one
+    await get_hydra_admin_client().aclose()
+    get_hydra_admin_client.cache_clear()
 
 
 def create_app() -> FastAPI:
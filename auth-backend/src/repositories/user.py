@@ -1,15 +1,25 @@
 """User repository for database operations."""
 
 from typing import List, Optional
+from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import bindparam, func, inspect, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import contains_eager, selectinload
+from sqlalchemy.orm.util import identity_key
 
 from ..models.role import Role
 from ..models.user import User
+from ..models.user_roles import user_roles
 from .base import BaseRepository
 
+# Upper bound on page size for list queries, protects against pathologically large pages
+MAX_PAGE_SIZE = 200
+
+# Hot lookups are built once at import time rather than on every call
+_BY_EMAIL_STMT = select(User).options(selectinload(User.roles)).where(User.email == bindparam("email"))
+_BY_ID_WITH_ROLES_STMT = select(User).options(selectinload(User.roles)).where(User.id == bindparam("user_id"))
+
 
 class UserRepository(BaseRepository[User]):
     """Repository for user-related database operations."""
@@ -19,16 +29,33 @@ class UserRepository(BaseRepository[User]):
 
     async def get_by_email(self, email: str) -> Optional[User]:
         """Get user by email address."""
-        result = await self.db.execute(select(User).options(selectinload(User.roles)).where(User.email == email))
+        result = await self.db.execute(_BY_EMAIL_STMT, {"email": email})
         return result.scalar_one_or_none()
 
     async def get_by_id_with_roles(self, user_id: str) -> Optional[User]:
         """Get user by ID with roles preloaded."""
-        result = await self.db.execute(select(User).options(selectinload(User.roles)).where(User.id == user_id))
+        user = self._get_loaded_user(user_id)
+        if user is not None:
+            return user
+
+        result = await self.db.execute(_BY_ID_WITH_ROLES_STMT, {"user_id": user_id})
         return result.scalar_one_or_none()
 
+    def _get_loaded_user(self, user_id: str) -> Optional[User]:
+        """Return the user from the session identity map if it is already loaded with its roles."""
+        try:
+            key = identity_key(User, UUID(str(user_id)))
+        except ValueError:
+            return None
+
+        user = self.db.identity_map.get(key)
+        if user is None or "roles" in inspect(user).unloaded:
+            return None
+        return user
+
     async def get_all_with_roles(self, skip: int = 0, limit: int = 100) -> List[User]:
         """Get all users with roles preloaded."""
+        limit = min(limit, MAX_PAGE_SIZE)
         result = await self.db.execute(
             select(User).options(selectinload(User.roles)).offset(skip).limit(limit).order_by(User.created_at.desc())
         )
@@ -36,14 +63,24 @@ class UserRepository(BaseRepository[User]):
 
     async def get_users_by_role(self, role_id: str) -> List[User]:
         """Get all users with a specific role."""
+        # Filter on membership in a subquery so the joined roles collection stays complete,
+        # then populate User.roles from the same JOIN instead of a second selectin query.
+        members = select(user_roles.c.user_id).where(user_roles.c.role_id == role_id)
         result = await self.db.execute(
             select(User)
-            .options(selectinload(User.roles))
             .join(User.roles)
-            .where(Role.id == role_id)
+            .where(User.id.in_(members))
+            .options(contains_eager(User.roles))
             .order_by(User.created_at.desc())
         )
-        return list(result.scalars().all())
+        return list(result.unique().scalars().all())
+
+    async def count_by_role(self, role_id: str) -> int:
+        """Count users with a specific role without loading them."""
+        result = await self.db.execute(
+            select(func.count()).select_from(user_roles).where(user_roles.c.role_id == role_id)
+        )
+        return result.scalar_one()
 
     async def get_users_without_role(self, role_id: str) -> List[User]:
         """Get all users who don't have a specific role."""
@@ -94,13 +131,9 @@ class UserRepository(BaseRepository[User]):
 
     async def update_password(self, user_id: str, password_hash: str) -> bool:
         """Update user's password hash."""
-        user = await self.get_by_id(user_id)
-        if not user:
-            return False
-
-        user.password_hash = password_hash
+        result = await self.db.execute(update(User).where(User.id == user_id).values(password_hash=password_hash))
         await self.db.commit()
-        return True
+        return result.rowcount == 1
 
     async def delete_user_with_roles(self, user_id: str) -> bool:
         """Delete a user and cascade delete all associated user-role relationships."""
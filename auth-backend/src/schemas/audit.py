@@ -3,12 +3,14 @@
 from datetime import datetime
 from typing import Any, Dict, Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, field_validator
 
 
 class AuditLogResponse(BaseModel):
     """Audit log response schema matching frontend interface."""
 
+    model_config = ConfigDict(from_attributes=True)
+
     id: str
     action: str
     resource_type: str
@@ -19,5 +21,8 @@ class AuditLogResponse(BaseModel):
     user_agent: Optional[str] = None
     timestamp: datetime
 
-    class Config:
-        from_attributes = True
+    @field_validator("id", mode="before")
+    @classmethod
+    def stringify_id(cls, v: Any) -> str:
+        """Accept UUID primary keys straight from the ORM model."""
+        return str(v)
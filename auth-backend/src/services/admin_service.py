@@ -1,7 +1,11 @@
 """Admin service for system-wide operations."""
 
+from functools import lru_cache
+from pathlib import Path
 from typing import List, Optional
 
+from pydantic import TypeAdapter
+
 from ..core.config import settings
 from ..core.logging_config import get_logger
 from ..repositories.audit_log import AuditLogRepository
@@ -13,6 +17,31 @@ from ..schemas.common import SystemStatsResponse
 
 logger = get_logger(__name__)
 
+# Validates a whole list of ORM rows in a single call instead of one model per row
+_audit_log_list_adapter = TypeAdapter(List[AuditLogResponse])
+
+
+# Returned for development when no key file is configured
+_PLACEHOLDER_JWT_PUBLIC_KEY = """-----BEGIN PUBLIC KEY-----
+MIIBIjANBgkqhkiG9w0BAQEFAAOCAQ8AMIIBCgKCAQEA1234567890...
+-----END PUBLIC KEY-----"""
+
+
+@lru_cache(maxsize=1)
+def _load_jwt_public_key_bytes(path: Path) -> str:
+    """Read the JWT public key (or the placeholder if the file is missing) once and keep it until the cache is cleared.
+
+    The existence check lives here so cached requests make no filesystem calls at all.
+    """
+    if not path.exists():
+        return _PLACEHOLDER_JWT_PUBLIC_KEY
+    return path.read_text()
+
+
+def clear_jwt_public_key_cache() -> None:
+    """Drop the cached JWT public key so the next request re-reads it (e.g. after key rotation)."""
+    _load_jwt_public_key_bytes.cache_clear()
+
 
 class AdminService:
     """Service for admin-related operations."""
@@ -38,20 +67,7 @@ class AdminService:
         """Get audit logs with optional filtering."""
         logs = await self.audit_repo.get_by_resource(resource_type=resource_type, resource_id=resource_id, limit=limit)
 
-        return [
-            AuditLogResponse(
-                id=str(log.id),
-                action=log.action,
-                resource_type=log.resource_type,
-                resource_id=log.resource_id,
-                details=log.details,
-                performed_by=log.performed_by,
-                ip_address=log.ip_address,
-                user_agent=log.user_agent,
-                timestamp=log.timestamp,
-            )
-            for log in logs
-        ]
+        return _audit_log_list_adapter.validate_python(logs, from_attributes=True)
 
     async def get_system_stats(self) -> SystemStatsResponse:
         """Get system statistics."""
@@ -72,14 +88,7 @@ class AdminService:
     async def get_jwt_public_key(self) -> str:
         """Get JWT public key."""
         try:
-            public_key_path = settings.jwt_public_key_path
-            if public_key_path.exists():
-                return public_key_path.read_text()
-            else:
-                # Return a placeholder key for development
-                return """-----BEGIN PUBLIC KEY-----
-MIIBIjANBgkqhkiG9w0BAQEFAAOCAQ8AMIIBCgKCAQEA1234567890...
------END PUBLIC KEY-----"""
+            return _load_jwt_public_key_bytes(settings.jwt_public_key_path)
         except Exception as e:
             logger.error(f"Failed to read JWT public key: {e}")
             raise ValueError("JWT public key not available")
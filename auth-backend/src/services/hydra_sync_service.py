@@ -12,7 +12,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..models.service_account import ServiceAccount
 from ..repositories.service_account import ServiceAccountRepository
-from ..services.hydra_client import HydraAdminClient
+from ..services.hydra_client import get_hydra_admin_client
 
 logger = logging.getLogger(__name__)
 
@@ -59,7 +59,7 @@ class HydraSyncService:
 
     def __init__(self, db: AsyncSession):
         self.db = db
-        self.hydra_client = HydraAdminClient()
+        self.hydra_client = get_hydra_admin_client()
         self.service_account_repo = ServiceAccountRepository(db)
 
     async def sync_all(self) -> HydraSyncResult:
@@ -5,26 +5,31 @@ import string
 from datetime import datetime
 from typing import List, Optional
 
-from argon2 import PasswordHasher
-
 from ..core.logging_config import get_logger
 from ..models.user import User
 from ..repositories.audit_log import AuditLogRepository
 from ..repositories.role import RoleRepository
 from ..repositories.user import UserRepository
 from ..schemas.user import UserCreate, UserPasswordReset, UserResponse, UserUpdate
+from .auth_service import AuthService, get_auth_service
 
 logger = get_logger(__name__)
-ph = PasswordHasher()
 
 
 class UserService:
     """Service for user-related business logic."""
 
-    def __init__(self, user_repo: UserRepository, role_repo: RoleRepository, audit_repo: AuditLogRepository):
+    def __init__(
+        self,
+        user_repo: UserRepository,
+        role_repo: RoleRepository,
+        audit_repo: AuditLogRepository,
+        auth_service: Optional[AuthService] = None,
+    ):
         self.user_repo = user_repo
         self.role_repo = role_repo
         self.audit_repo = audit_repo
+        self.auth_service = auth_service or get_auth_service()
 
     async def get_users(self, skip: int = 0, limit: int = 100) -> List[UserResponse]:
         """Get all users."""
@@ -41,7 +46,7 @@ class UserService:
             raise ValueError(f"User with email {user_data.email} already exists")
 
         # Hash the password
-        hashed_password = ph.hash(user_data.password)
+        hashed_password = await self.auth_service.hash_password_async(user_data.password)
 
         # Create user data dict
         user_dict = {
@@ -89,7 +94,7 @@ class UserService:
             update_dict["locked_until"] = user_data.locked_until
         if user_data.password is not None:
             # Hash the new password
-            update_dict["password_hash"] = ph.hash(user_data.password)
+            update_dict["password_hash"] = await self.auth_service.hash_password_async(user_data.password)
 
         update_dict["updated_at"] = datetime.utcnow()
 
@@ -163,7 +168,7 @@ class UserService:
             return False
 
         # Create password hasher and hash new password
-        password_hash = ph.hash(password_data.new_password)
+        password_hash = await self.auth_service.hash_password_async(password_data.new_password)
 
         # Update password
         success = await self.user_repo.update_password(user_id, password_hash)
@@ -280,18 +285,13 @@ class UserService:
         try:
             user = await self.user_repo.get_by_email(email)
             if not user:
+                # Still pay for an Argon2 verify (the empty hash takes the dummy path) so response
+                # time does not reveal whether the account exists
+                await self.auth_service.verify_password_async(password, None)
                 return None
 
             # Verify password using Argon2
-            try:
-                ph.verify(user.password_hash, password)
-
-                # Successful login: update last_login_at and reset failed attempts
-                await self.user_repo.update(user, {"last_login_at": datetime.now(), "failed_login_attempts": 0})
-
-                logger.info(f"User authenticated successfully: {email}")
-                return user
-            except Exception:
+            if not await self.auth_service.verify_password_async(password, user.password_hash):
                 # Password verification failed: increment failed login attempts
                 current_attempts = getattr(user, "failed_login_attempts", 0) or 0
                 await self.user_repo.update(user, {"failed_login_attempts": current_attempts + 1})
@@ -301,6 +301,12 @@ class UserService:
                 )
                 return None
 
+            # Successful login: update last_login_at and reset failed attempts
+            await self.user_repo.update(user, {"last_login_at": datetime.now(), "failed_login_attempts": 0})
+
+            logger.info(f"User authenticated successfully: {email}")
+            return user
+
         except Exception as e:
             logger.error(f"Error authenticating user {email}: {str(e)}")
             return None
@@ -4,6 +4,8 @@ Pytest configuration and fixtures for auth-backend tests.
 This module provides common test fixtures including mocked database sessions,
 test data factories, and shared testing utilities.
 """
+import asyncio
+
 import pytest
 from unittest.mock import AsyncMock, MagicMock, Mock
 from uuid import uuid4
@@ -19,6 +21,19 @@ from src.models.role import Role
 from src.models.user import User
 from src.models.audit_log import AuditLog
 
+try:
+    import uvloop
+except ImportError:  # pragma: no cover - uvloop is not available on Windows
+    uvloop = None
+
+
+@pytest.fixture(scope="session")
+def event_loop_policy():
+    """Run async tests on uvloop when it is installed, falling back to the default asyncio loop."""
+    if uvloop is None:
+        return asyncio.DefaultEventLoopPolicy()
+    return uvloop.EventLoopPolicy()
+
 
 @pytest.fixture
 def mock_async_session():
@@ -30,6 +45,7 @@ def mock_async_session():
     mock_session.execute = AsyncMock()
     mock_session.scalar = AsyncMock()
     mock_session.scalars = AsyncMock()
+    mock_session.identity_map = {}
     return mock_session
 
 
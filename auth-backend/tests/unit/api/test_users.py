@@ -0,0 +1,54 @@
+"""
+Unit tests for the user management API endpoints.
+
+Runs the users router on a bare FastAPI app with the service and
+authentication dependencies overridden, so only request validation
+and routing are exercised.
+"""
+from unittest.mock import AsyncMock, call
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.api.v1.users import get_user_service, router
+from src.middleware.auth import get_current_user
+from src.repositories.user import MAX_PAGE_SIZE
+from src.services.user_service import UserService
+
+
+@pytest.fixture
+def user_service():
+    """Create mock UserService returning no users."""
+    service = AsyncMock(spec_set=UserService)
+    service.get_users.return_value = []
+    return service
+
+
+@pytest.fixture
+def client(user_service):
+    """Create a test client for the users router with dependencies overridden."""
+    app = FastAPI()
+    app.include_router(router)
+    app.dependency_overrides[get_user_service] = lambda: user_service
+    app.dependency_overrides[get_current_user] = lambda: {"sub": "admin@example.com"}
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+class TestGetUsers:
+    """Test suite for GET /users."""
+
+    def test_get_users_accepts_max_page_size(self, client, user_service):
+        """Test that a page of exactly MAX_PAGE_SIZE is passed through to the service."""
+        response = client.get("/users", params={"limit": MAX_PAGE_SIZE})
+
+        assert response.status_code == 200
+        assert user_service.get_users.call_args_list == [call(skip=0, limit=MAX_PAGE_SIZE)]
+
+    def test_get_users_rejects_limit_over_max_page_size(self, client, user_service):
+        """Test that an oversized page is rejected with 422 instead of being silently truncated."""
+        response = client.get("/users", params={"limit": MAX_PAGE_SIZE + 1})
+
+        assert response.status_code == 422
+        user_service.get_users.assert_not_called()
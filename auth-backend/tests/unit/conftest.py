@@ -0,0 +1,104 @@
+"""
+Shared fixtures for the unit test suite.
+
+Provides session-scoped, spec'd mocks for the services' repositories and
+Hydra client, reset after every test, and a factory for lightweight
+sample service accounts.
+"""
+from types import MappingProxyType, SimpleNamespace
+from unittest.mock import AsyncMock
+from uuid import UUID
+
+import pytest
+
+from src.repositories.audit_log import AuditLogRepository
+from src.repositories.role import RoleRepository
+from src.repositories.service_account import ServiceAccountRepository
+from src.repositories.user import UserRepository
+from src.services.hydra_client import HydraAdminClient
+from src.services.service_account_service import ServiceAccountService
+
+# Deterministic ids handed out in order, restarting for every test so runs are reproducible
+_UUID_POOL = tuple(UUID(int=i) for i in range(1, 257))
+
+# Read-only Hydra payloads shared by every sample account with the same client_id
+_HYDRA_CLIENTS = {}
+
+# Session mocks built by the fixtures below, reset after every test
+_SHARED_MOCKS = []
+
+
+def _shared_mock(spec):
+    """Create a spec'd session mock and register it for the per-test reset."""
+    mock = AsyncMock(spec_set=spec)
+    _SHARED_MOCKS.append(mock)
+    return mock
+
+
+@pytest.fixture(autouse=True)
+def _reset_shared_mocks():
+    """Reset the shared mocks after each test so no return_value, side_effect or call history leaks."""
+    yield
+    for mock in _SHARED_MOCKS:
+        mock.reset_mock(return_value=True, side_effect=True)
+
+
+@pytest.fixture(scope="session")
+def service_account_repo():
+    """Create mock ServiceAccountRepository."""
+    return _shared_mock(ServiceAccountRepository)
+
+
+@pytest.fixture(scope="session")
+def role_repo():
+    """Create mock RoleRepository."""
+    return _shared_mock(RoleRepository)
+
+
+@pytest.fixture(scope="session")
+def user_repo():
+    """Create mock UserRepository."""
+    return _shared_mock(UserRepository)
+
+
+@pytest.fixture(scope="session")
+def audit_repo():
+    """Create mock AuditLogRepository."""
+    return _shared_mock(AuditLogRepository)
+
+
+@pytest.fixture(scope="session")
+def hydra_client():
+    """Create mock HydraAdminClient."""
+    return _shared_mock(HydraAdminClient)
+
+
+@pytest.fixture(scope="session")
+def service(service_account_repo, role_repo, hydra_client):
+    """Create ServiceAccountService instance with mocked dependencies."""
+    return ServiceAccountService(service_account_repo, role_repo, hydra_client)
+
+
+@pytest.fixture
+def next_uuid():
+    """Return a callable yielding the next id from the deterministic pool."""
+    return iter(_UUID_POOL).__next__
+
+
+@pytest.fixture
+def make_service_account(next_uuid):
+    """Return a factory for sample service accounts.
+
+    Plain attributes cover everything the service reads; a MagicMock would auto-create the rest.
+    """
+    def factory(**kwargs):
+        client_id = kwargs.get('client_id', 'svc-123')
+        hydra_data = _HYDRA_CLIENTS.setdefault(client_id, MappingProxyType({"client_id": client_id}))
+        return SimpleNamespace(
+            id=kwargs.get('id') or next_uuid(),
+            client_id=client_id,
+            roles=kwargs.get('roles', []),
+            to_hydra_client=lambda: hydra_data,
+        )
+
+    return factory
@@ -6,13 +6,25 @@ using mocked database sessions to avoid actua    @pytest.mark.asyncio
     async def test_get_users_by_role(self, mock_async_session, sample_users_with_roles, sample_admin_role):ies.
 """
 import pytest
+import types
 from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import UUID, uuid4
 from datetime import datetime, timezone
 
-from src.repositories.user import UserRepository
+from src.repositories.user import MAX_PAGE_SIZE, UserRepository
 from src.models.user import User
 from src.models.role import Role
+from sqlalchemy.orm.util import identity_key
+
+
+def _scalar_result(value):
+    """Build a lightweight result whose scalar_one_or_none() returns value."""
+    return types.SimpleNamespace(scalar_one_or_none=lambda: value)
+
+
+def _scalars_all_result(items):
+    """Build a lightweight result whose scalars().all() returns items."""
+    return types.SimpleNamespace(scalars=lambda: types.SimpleNamespace(all=lambda: items))
 
 
 class TestUserRepository:
@@ -29,9 +41,7 @@ class TestUserRepository:
         """Test getting user by email when it exists."""
         # Arrange
         repo = UserRepository(mock_async_session)
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = sample_user
-        mock_async_session.execute.return_value = mock_result
+        mock_async_session.execute.return_value = _scalar_result(sample_user)
 
         # Act
         result = await repo.get_by_email("test@example.com")
@@ -45,9 +55,7 @@ class TestUserRepository:
         """Test getting user by email when it doesn't exist."""
         # Arrange
         repo = UserRepository(mock_async_session)
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = None
-        mock_async_session.execute.return_value = mock_result
+        mock_async_session.execute.return_value = _scalar_result(None)
 
         # Act
         result = await repo.get_by_email("nonexistent@example.com")
@@ -56,14 +64,29 @@ class TestUserRepository:
         assert result is None
         mock_async_session.execute.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_get_by_email_cached_compilation(self, mock_async_session, sample_user):
+        """Test that get_by_email reuses one prebuilt statement so SQLAlchemy can cache its compilation."""
+        # Arrange
+        repo = UserRepository(mock_async_session)
+        mock_async_session.execute.return_value = _scalar_result(sample_user)
+
+        # Act
+        await repo.get_by_email("test@example.com")
+        await repo.get_by_email("other@example.com")
+
+        # Assert
+        first_call, second_call = mock_async_session.execute.call_args_list
+        assert first_call.args[0] is second_call.args[0]
+        assert first_call.args[1] == {"email": "test@example.com"}
+        assert second_call.args[1] == {"email": "other@example.com"}
+
     @pytest.mark.asyncio
     async def test_get_by_id_with_roles_found(self, mock_async_session, sample_user_with_roles):
         """Test getting user by ID with roles when it exists."""
         # Arrange
         repo = UserRepository(mock_async_session)
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = sample_user_with_roles
-        mock_async_session.execute.return_value = mock_result
+        mock_async_session.execute.return_value = _scalar_result(sample_user_with_roles)
 
         # Act
         result = await repo.get_by_id_with_roles(str(sample_user_with_roles.id))
@@ -78,9 +101,7 @@ class TestUserRepository:
         """Test getting user by ID with roles when it doesn't exist."""
         # Arrange
         repo = UserRepository(mock_async_session)
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = None
-        mock_async_session.execute.return_value = mock_result
+        mock_async_session.execute.return_value = _scalar_result(None)
 
         # Act
         result = await repo.get_by_id_with_roles(str(uuid4()))
@@ -94,11 +115,7 @@ class TestUserRepository:
         """Test getting all users with roles."""
         # Arrange
         repo = UserRepository(mock_async_session)
-        mock_result = MagicMock()
-        mock_scalars = MagicMock()
-        mock_scalars.all.return_value = sample_users_with_roles
-        mock_result.scalars.return_value = mock_scalars
-        mock_async_session.execute.return_value = mock_result
+        mock_async_session.execute.return_value = _scalars_all_result(sample_users_with_roles)
 
         # Act
         result = await repo.get_all_with_roles(skip=0, limit=100)
@@ -113,11 +130,7 @@ class TestUserRepository:
         """Test getting all users with pagination."""
         # Arrange
         repo = UserRepository(mock_async_session)
-        mock_result = MagicMock()
-        mock_scalars = MagicMock()
-        mock_scalars.all.return_value = []
-        mock_result.scalars.return_value = mock_scalars
-        mock_async_session.execute.return_value = mock_result
+        mock_async_session.execute.return_value = _scalars_all_result([])
 
         # Act
         result = await repo.get_all_with_roles(skip=10, limit=5)
@@ -126,6 +139,20 @@ class TestUserRepository:
         assert result == []
         mock_async_session.execute.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_get_all_with_roles_clamps_limit_to_max(self, mock_async_session):
+        """Test that oversized page requests are capped at MAX_PAGE_SIZE."""
+        # Arrange
+        repo = UserRepository(mock_async_session)
+        mock_async_session.execute.return_value = _scalars_all_result([])
+
+        # Act
+        await repo.get_all_with_roles(limit=10_000)
+
+        # Assert
+        statement = mock_async_session.execute.call_args.args[0]
+        assert statement._limit_clause.value == MAX_PAGE_SIZE
+
     @pytest.mark.asyncio
     @pytest.mark.asyncio
     async def test_get_users_by_role(self, mock_async_session, sample_users_with_roles, sample_admin_role):
@@ -133,11 +160,9 @@ class TestUserRepository:
         # Arrange
         repo = UserRepository(mock_async_session)
         users_with_role = [user for user in sample_users_with_roles if sample_admin_role in user.roles]
-        mock_result = MagicMock()
-        mock_scalars = MagicMock()
-        mock_scalars.all.return_value = users_with_role
-        mock_result.scalars.return_value = mock_scalars
-        mock_async_session.execute.return_value = mock_result
+        mock_async_session.execute.return_value = types.SimpleNamespace(
+            unique=lambda: _scalars_all_result(users_with_role)
+        )
 
         # Act
         result = await repo.get_users_by_role(str(sample_admin_role.id))
@@ -146,6 +171,46 @@ class TestUserRepository:
         assert result == users_with_role
         mock_async_session.execute.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_get_users_by_role_single_joined_select(self, mock_async_session, sample_admin_role):
+        """Test that users by role load their roles with contains_eager rather than selectinload."""
+        # Arrange
+        repo = UserRepository(mock_async_session)
+        mock_async_session.execute.return_value = types.SimpleNamespace(unique=lambda: _scalars_all_result([]))
+
+        # Act
+        await repo.get_users_by_role(str(sample_admin_role.id))
+
+        # Assert
+        statement = mock_async_session.execute.call_args.args[0]
+        loads = [load for option in statement._with_options for load in option.context]
+        assert loads
+        assert all(load.strategy == (("lazy", "joined"),) for load in loads)
+        assert all("eager_from_alias" in load.local_opts for load in loads)
+        assert "JOIN user_roles" in str(statement)
+
+    @pytest.mark.asyncio
+    async def test_count_by_role(self, mock_async_session, sample_admin_role):
+        """Test counting users by role with a single COUNT query."""
+        # Arrange
+        repo = UserRepository(mock_async_session)
+        role_id = str(sample_admin_role.id)
+        mock_result = MagicMock()
+        mock_result.scalar_one.return_value = 5
+        mock_async_session.execute.return_value = mock_result
+
+        # Act
+        result = await repo.count_by_role(role_id)
+
+        # Assert
+        assert result == 5
+        mock_result.scalar_one.assert_called_once_with()
+        mock_async_session.execute.assert_called_once()
+        compiled = mock_async_session.execute.call_args.args[0].compile()
+        sql = " ".join(str(compiled).split())
+        assert sql.startswith("SELECT count(*) AS count_1 FROM user_roles WHERE user_roles.role_id = ")
+        assert list(compiled.params.values()) == [role_id]
+
     @pytest.mark.asyncio
     async def test_get_users_without_role(self, mock_async_session, sample_users_with_roles, sample_admin_role):
         """Test getting users without a specific role."""
@@ -161,11 +226,7 @@ class TestUserRepository:
         # Mock should return only users without the role
         users_without_role = [user_without_role]  # Only the user without the admin role
         
-        mock_result = MagicMock()
-        mock_scalars = MagicMock()
-        mock_scalars.all.return_value = users_without_role
-        mock_result.scalars.return_value = mock_scalars
-        mock_async_session.execute.return_value = mock_result
+        mock_async_session.execute.return_value = _scalars_all_result(users_without_role)
 
         # Act
         result = await repo.get_users_without_role(str(sample_admin_role.id))
@@ -184,9 +245,7 @@ class TestUserRepository:
         # Mock get_by_id_with_roles to return the user
         with patch.object(repo, 'get_by_id_with_roles', return_value=sample_user):
             # Mock the role query to return the role
-            mock_role_result = MagicMock()
-            mock_role_result.scalar_one_or_none.return_value = sample_admin_role
-            mock_async_session.execute.return_value = mock_role_result
+            mock_async_session.execute.return_value = _scalar_result(sample_admin_role)
             
             # Act
             result = await repo.assign_role(str(sample_user.id), str(sample_admin_role.id))
@@ -196,6 +255,24 @@ class TestUserRepository:
             mock_async_session.commit.assert_called_once()
             assert sample_admin_role in sample_user.roles
 
+    @pytest.mark.asyncio
+    async def test_assign_role_reuses_identity_map(self, mock_async_session, sample_user, sample_admin_role):
+        """Test that a user already loaded in the session is not selected again."""
+        # Arrange
+        repo = UserRepository(mock_async_session)
+        mock_async_session.execute.side_effect = [_scalar_result(sample_user), _scalar_result(sample_admin_role)]
+
+        # Act
+        await repo.get_by_id_with_roles(str(sample_user.id))
+        # Simulate the session registering the loaded user in its identity map
+        mock_async_session.identity_map[identity_key(User, sample_user.id)] = sample_user
+        result = await repo.assign_role(str(sample_user.id), str(sample_admin_role.id))
+
+        # Assert
+        assert result is True
+        assert mock_async_session.execute.call_count == 2  # one user SELECT + one role SELECT
+        assert sample_admin_role in sample_user.roles
+
     @pytest.mark.asyncio
     async def test_assign_role_already_assigned(self, mock_async_session, sample_user_with_roles):
         """Test assigning a role that's already assigned."""
@@ -206,9 +283,7 @@ class TestUserRepository:
         # Mock get_by_id_with_roles to return the user with existing role
         with patch.object(repo, 'get_by_id_with_roles', return_value=sample_user_with_roles):
             # Mock the role query to return the existing role
-            mock_role_result = MagicMock()
-            mock_role_result.scalar_one_or_none.return_value = existing_role
-            mock_async_session.execute.return_value = mock_role_result
+            mock_async_session.execute.return_value = _scalar_result(existing_role)
             
             # Act
             result = await repo.assign_role(str(sample_user_with_roles.id), str(existing_role.id))
@@ -242,9 +317,7 @@ class TestUserRepository:
         # Mock get_by_id_with_roles to return the user
         with patch.object(repo, 'get_by_id_with_roles', return_value=sample_user):
             # Mock the role query to return None (role not found)
-            mock_role_result = MagicMock()
-            mock_role_result.scalar_one_or_none.return_value = None
-            mock_async_session.execute.return_value = mock_role_result
+            mock_async_session.execute.return_value = _scalar_result(None)
 
             # Act
             result = await repo.assign_role(str(sample_user.id), str(uuid4()))
@@ -306,28 +379,48 @@ class TestUserRepository:
         # Arrange
         repo = UserRepository(mock_async_session)
         new_password_hash = "new_hashed_password_123"
-        
-        # Mock get_by_id to return the user
-        with patch.object(repo, 'get_by_id', return_value=sample_user):
-            # Act
-            result = await repo.update_password(str(sample_user.id), new_password_hash)
+        mock_result = MagicMock()
+        mock_result.rowcount = 1
+        mock_async_session.execute.return_value = mock_result
 
-            # Assert
-            assert result is True
-            assert sample_user.password_hash == new_password_hash
-            mock_async_session.commit.assert_called_once()
+        # Act
+        result = await repo.update_password(str(sample_user.id), new_password_hash)
+
+        # Assert
+        assert result is True
+        mock_async_session.execute.assert_called_once()
+        mock_async_session.commit.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_update_password_user_not_found(self, mock_async_session):
         """Test updating password when user doesn't exist."""
         # Arrange
         repo = UserRepository(mock_async_session)
-        
-        # Mock get_by_id to return None
-        with patch.object(repo, 'get_by_id', return_value=None):
-            # Act
-            result = await repo.update_password(str(uuid4()), "new_password_hash")
+        mock_result = MagicMock()
+        mock_result.rowcount = 0
+        mock_async_session.execute.return_value = mock_result
 
-            # Assert
-            assert result is False
-            mock_async_session.commit.assert_not_called()
+        # Act
+        result = await repo.update_password(str(uuid4()), "new_password_hash")
+
+        # Assert
+        assert result is False
+        mock_async_session.execute.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_update_password_uses_bulk_update(self, mock_async_session, sample_user):
+        """Test that updating a password issues a single UPDATE without loading the user."""
+        # Arrange
+        repo = UserRepository(mock_async_session)
+        mock_result = MagicMock()
+        mock_result.rowcount = 1
+        mock_async_session.execute.return_value = mock_result
+
+        # Act
+        await repo.update_password(str(sample_user.id), "new_hashed_password_123")
+
+        # Assert
+        statement = mock_async_session.execute.call_args.args[0]
+        assert statement.is_dml
+        assert str(statement).startswith("UPDATE users SET")
+        assert "password_hash" in str(statement)
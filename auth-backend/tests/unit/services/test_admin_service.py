@@ -6,36 +6,66 @@ system statistics, and JWT public key management.
 """
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
-from datetime import datetime
+from dataclasses import dataclass
+from datetime import datetime, timezone
 from pathlib import Path
+from typing import Any, Dict, Optional
 
-from src.services.admin_service import AdminService
+from src.repositories.audit_log import AuditLogRepository
+from src.repositories.role import RoleRepository
+from src.repositories.service_account import ServiceAccountRepository
+from src.repositories.user import UserRepository
+from src.services.admin_service import AdminService, clear_jwt_public_key_cache
 from src.schemas.audit import AuditLogResponse
 from src.schemas.common import SystemStatsResponse
 
+_FROZEN_TS = datetime(2024, 1, 1, 0, 0, 0, tzinfo=timezone.utc)
+
+
+@dataclass(frozen=True, slots=True)
+class _FakeAuditLog:
+    """Lightweight stand-in for the AuditLog attributes read by AdminService."""
+
+    id: str
+    action: str
+    resource_type: str
+    resource_id: Optional[str]
+    details: Optional[Dict[str, Any]]
+    performed_by: str
+    ip_address: Optional[str]
+    user_agent: Optional[str]
+    timestamp: datetime
+
 
 class TestAdminService:
     """Test suite for AdminService operations."""
 
+    @pytest.fixture(autouse=True)
+    def clear_public_key_cache(self):
+        """Ensure each test starts with an empty JWT public key cache."""
+        clear_jwt_public_key_cache()
+        yield
+        clear_jwt_public_key_cache()
+
     @pytest.fixture
     def mock_audit_repo(self):
         """Create a mock AuditLogRepository."""
-        return AsyncMock()
+        return AsyncMock(spec=AuditLogRepository)
 
     @pytest.fixture
     def mock_user_repo(self):
         """Create a mock UserRepository."""
-        return AsyncMock()
+        return AsyncMock(spec=UserRepository)
 
     @pytest.fixture
     def mock_role_repo(self):
         """Create a mock RoleRepository."""
-        return AsyncMock()
+        return AsyncMock(spec=RoleRepository)
 
     @pytest.fixture
     def mock_service_account_repo(self):
         """Create a mock ServiceAccountRepository."""
-        return AsyncMock()
+        return AsyncMock(spec=ServiceAccountRepository)
 
     @pytest.fixture
     def admin_service(self, mock_audit_repo, mock_user_repo, mock_role_repo, mock_service_account_repo):
@@ -50,17 +80,17 @@ class TestAdminService:
     @pytest.fixture
     def sample_audit_log(self):
         """Create a sample audit log for testing."""
-        audit_log = MagicMock()
-        audit_log.id = "550e8400-e29b-41d4-a716-446655440000"
-        audit_log.action = "user_created"
-        audit_log.resource_type = "user"
-        audit_log.resource_id = "user123"
-        audit_log.details = {"email": "test@example.com"}
-        audit_log.performed_by = "admin123"
-        audit_log.ip_address = "192.168.1.1"
-        audit_log.user_agent = "Mozilla/5.0..."
-        audit_log.timestamp = datetime(2023, 1, 1, 12, 0, 0)
-        return audit_log
+        return _FakeAuditLog(
+            id="550e8400-e29b-41d4-a716-446655440000",
+            action="user_created",
+            resource_type="user",
+            resource_id="user123",
+            details={"email": "test@example.com"},
+            performed_by="admin123",
+            ip_address="192.168.1.1",
+            user_agent="Mozilla/5.0...",
+            timestamp=datetime(2023, 1, 1, 12, 0, 0, tzinfo=timezone.utc),
+        )
 
     @pytest.fixture
     def sample_user(self):
@@ -135,27 +165,29 @@ class TestAdminService:
 
     async def test_get_audit_logs_multiple_logs(self, admin_service, mock_audit_repo):
         """Test get_audit_logs with multiple logs."""
-        log1 = MagicMock()
-        log1.id = "log1"
-        log1.action = "user_created"
-        log1.resource_type = "user"
-        log1.resource_id = "user1"
-        log1.details = {}
-        log1.performed_by = "admin1"
-        log1.ip_address = "192.168.1.1"
-        log1.user_agent = "Browser1"
-        log1.timestamp = datetime.now()
-        
-        log2 = MagicMock()
-        log2.id = "log2"
-        log2.action = "user_updated"
-        log2.resource_type = "user"
-        log2.resource_id = "user2"
-        log2.details = {}
-        log2.performed_by = "admin2"
-        log2.ip_address = "192.168.1.2"
-        log2.user_agent = "Browser2"
-        log2.timestamp = datetime.now()
+        log1 = _FakeAuditLog(
+            id="log1",
+            action="user_created",
+            resource_type="user",
+            resource_id="user1",
+            details={},
+            performed_by="admin1",
+            ip_address="192.168.1.1",
+            user_agent="Browser1",
+            timestamp=_FROZEN_TS,
+        )
+
+        log2 = _FakeAuditLog(
+            id="log2",
+            action="user_updated",
+            resource_type="user",
+            resource_id="user2",
+            details={},
+            performed_by="admin2",
+            ip_address="192.168.1.2",
+            user_agent="Browser2",
+            timestamp=_FROZEN_TS,
+        )
         
         mock_audit_repo.get_by_resource.return_value = [log1, log2]
         
@@ -243,6 +275,24 @@ MIIBIjANBgkqhkiG9w0BAQEFAAOCAQ8AMIIBCgKCAQEA1234567890...
         mock_path.read_text.assert_called_once()
         assert result == mock_key_content
 
+    @patch('src.services.admin_service.settings')
+    async def test_get_jwt_public_key_cached(self, mock_settings, admin_service):
+        """Test get_jwt_public_key reads the key file only once."""
+        mock_key_content = "-----BEGIN PUBLIC KEY-----\ncached\n-----END PUBLIC KEY-----"
+
+        mock_path = MagicMock(spec=Path)
+        mock_path.exists.return_value = True
+        mock_path.read_text.return_value = mock_key_content
+        mock_settings.jwt_public_key_path = mock_path
+
+        first = await admin_service.get_jwt_public_key()
+        second = await admin_service.get_jwt_public_key()
+
+        # The cached request touches the filesystem neither to stat nor to read
+        mock_path.exists.assert_called_once()
+        mock_path.read_text.assert_called_once()
+        assert first == second == mock_key_content
+
     @patch('src.services.admin_service.settings')
     async def test_get_jwt_public_key_file_not_exists(self, mock_settings, admin_service):
         """Test get_jwt_public_key when file doesn't exist."""
@@ -270,16 +320,17 @@ MIIBIjANBgkqhkiG9w0BAQEFAAOCAQ8AMIIBCgKCAQEA1234567890...
 
     async def test_get_audit_logs_preserves_all_fields(self, admin_service, mock_audit_repo):
         """Test that get_audit_logs preserves all audit log fields."""
-        audit_log = MagicMock()
-        audit_log.id = "test-id"
-        audit_log.action = "test_action"
-        audit_log.resource_type = "test_resource"
-        audit_log.resource_id = "test_resource_id"
-        audit_log.details = {"key": "value"}
-        audit_log.performed_by = "test_user"
-        audit_log.ip_address = "10.0.0.1"
-        audit_log.user_agent = "Test Agent"
-        audit_log.timestamp = datetime(2023, 6, 15, 10, 30, 0)
+        audit_log = _FakeAuditLog(
+            id="test-id",
+            action="test_action",
+            resource_type="test_resource",
+            resource_id="test_resource_id",
+            details={"key": "value"},
+            performed_by="test_user",
+            ip_address="10.0.0.1",
+            user_agent="Test Agent",
+            timestamp=datetime(2023, 6, 15, 10, 30, 0, tzinfo=timezone.utc),
+        )
         
         mock_audit_repo.get_by_resource.return_value = [audit_log]
         
@@ -295,7 +346,7 @@ MIIBIjANBgkqhkiG9w0BAQEFAAOCAQ8AMIIBCgKCAQEA1234567890...
         assert response.performed_by == "test_user"
         assert response.ip_address == "10.0.0.1"
         assert response.user_agent == "Test Agent"
-        assert response.timestamp == datetime(2023, 6, 15, 10, 30, 0)
+        assert response.timestamp == datetime(2023, 6, 15, 10, 30, 0, tzinfo=timezone.utc)
 
     async def test_get_system_stats_handles_empty_collections(self, admin_service, mock_user_repo,
                                                            mock_role_repo, mock_service_account_repo):
@@ -5,17 +5,42 @@ Tests password hashing and verification functionality using Argon2.
 Validates security and correctness of authentication operations.
 """
 import pytest
+from unittest.mock import patch
 from argon2.exceptions import VerifyMismatchError
 
-from src.services.auth_service import AuthService
+from src.services import auth_service as auth_service_module
+from src.services.auth_service import AuthService, get_auth_service
+
+_ROUND_TRIP_PASSWORDS = [
+    "simple",
+    "complex_P@ssw0rd!",
+    "unicode_测试密码",
+    "numbers_123456789",
+    "symbols_!@#$%^&*()",
+    " spaces around ",
+]
+
+
+def _spy_verify_secret():
+    """Patch the low-level Argon2 verify so calls are recorded but still run."""
+    return patch.object(auth_service_module, "verify_secret", wraps=auth_service_module.verify_secret)
+
+
+@pytest.fixture(scope="module")
+def sample_hash():
+    """Hash "test_password_123" once for the verify tests that only need a valid hash."""
+    return AuthService().hash_password("test_password_123")
 
 
 class TestAuthService:
     """Test suite for AuthService password operations."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def auth_service(self):
-        """Create an AuthService instance for testing."""
+        """Create an AuthService instance shared by the module.
+
+        Its verify cache carries over from test to test, so tests that observe caching build their own instance.
+        """
         return AuthService()
 
     def test_hash_password_creates_hash(self, auth_service):
@@ -59,31 +84,23 @@ class TestAuthService:
         with pytest.raises(ValueError, match="Password cannot be empty"):
             auth_service.hash_password(None)
 
-    def test_verify_password_correct_password_returns_true(self, auth_service):
+    def test_verify_password_correct_password_returns_true(self, auth_service, sample_hash):
         """Test that verify_password returns True for correct password."""
-        password = "test_password_123"
-        password_hash = auth_service.hash_password(password)
-        
-        result = auth_service.verify_password(password, password_hash)
+        result = auth_service.verify_password("test_password_123", sample_hash)
         
         assert result is True
 
-    def test_verify_password_incorrect_password_returns_false(self, auth_service):
+    def test_verify_password_incorrect_password_returns_false(self, auth_service, sample_hash):
         """Test that verify_password returns False for incorrect password."""
-        password = "test_password_123"
         wrong_password = "wrong_password_456"
-        password_hash = auth_service.hash_password(password)
         
-        result = auth_service.verify_password(wrong_password, password_hash)
+        result = auth_service.verify_password(wrong_password, sample_hash)
         
         assert result is False
 
-    def test_verify_password_empty_password_returns_false(self, auth_service):
+    def test_verify_password_empty_password_returns_false(self, auth_service, sample_hash):
         """Test that verify_password returns False for empty password."""
-        password = "test_password_123"
-        password_hash = auth_service.hash_password(password)
-        
-        result = auth_service.verify_password("", password_hash)
+        result = auth_service.verify_password("", sample_hash)
         
         assert result is False
 
@@ -104,13 +121,12 @@ class TestAuthService:
         
         assert result is False
 
-    def test_verify_password_none_values_returns_false(self, auth_service):
+    def test_verify_password_none_values_returns_false(self, auth_service, sample_hash):
         """Test that verify_password handles None values gracefully."""
         password = "test_password_123"
-        password_hash = auth_service.hash_password(password)
         
         # Test None password
-        result = auth_service.verify_password(None, password_hash)
+        result = auth_service.verify_password(None, sample_hash)
         assert result is False
         
         # Test None hash
@@ -121,26 +137,16 @@ class TestAuthService:
         result = auth_service.verify_password(None, None)
         assert result is False
 
-    def test_hash_and_verify_round_trip(self, auth_service):
+    @pytest.mark.parametrize("password", _ROUND_TRIP_PASSWORDS)
+    def test_hash_and_verify_round_trip(self, auth_service, password):
         """Test complete hash and verify round trip."""
-        test_passwords = [
-            "simple",
-            "complex_P@ssw0rd!",
-            "unicode_测试密码",
-            "numbers_123456789",
-            "symbols_!@#$%^&*()",
-            " spaces around ",
-        ]
-        
-        for password in test_passwords:
-            # Hash the password
-            password_hash = auth_service.hash_password(password)
-            
-            # Verify it works
-            assert auth_service.verify_password(password, password_hash) is True
-            
-            # Verify wrong password fails
-            assert auth_service.verify_password(password + "wrong", password_hash) is False
+        password_hash = auth_service.hash_password(password)
+
+        # Verify it works
+        assert auth_service.verify_password(password, password_hash) is True
+
+        # Verify wrong password fails
+        assert auth_service.verify_password(password + "wrong", password_hash) is False
 
     def test_hash_password_consistent_format(self, auth_service):
         """Test that all generated hashes follow Argon2 format."""
@@ -156,14 +162,135 @@ class TestAuthService:
             parts = password_hash.split("$")
             assert len(parts) >= 5  # At least 5 parts in Argon2 hash
 
-    def test_verify_password_case_sensitive(self, auth_service):
+    def test_verify_password_case_sensitive(self, auth_service, sample_hash):
         """Test that password verification is case sensitive."""
-        password = "TestPassword123"
-        password_hash = auth_service.hash_password(password)
+        password = "test_password_123"
         
         # Correct case should work
-        assert auth_service.verify_password(password, password_hash) is True
+        assert auth_service.verify_password(password, sample_hash) is True
         
         # Different case should fail
-        assert auth_service.verify_password(password.lower(), password_hash) is False
-        assert auth_service.verify_password(password.upper(), password_hash) is False
+        assert auth_service.verify_password(password.capitalize(), sample_hash) is False
+        assert auth_service.verify_password(password.upper(), sample_hash) is False
+
+    def test_verify_password_caches_successful_verification(self):
+        """Test that a repeated successful verification skips the Argon2 verify."""
+        auth_service = AuthService()
+        password = "cached_password_123"
+        password_hash = auth_service.hash_password(password)
+
+        with _spy_verify_secret() as mock_verify:
+            assert auth_service.verify_password(password, password_hash) is True
+            assert auth_service.verify_password(password, password_hash) is True
+
+        mock_verify.assert_called_once()
+
+    def test_get_auth_service_returns_shared_instance(self):
+        """Test that callers share one AuthService, and with it one verify cache."""
+        assert get_auth_service() is get_auth_service()
+
+    def test_verify_cache_key_is_per_instance(self):
+        """Test that cache keys are HMACs under a per-instance secret."""
+        first, second = AuthService(), AuthService()
+
+        assert first._verify_cache_key("password", "hash") == first._verify_cache_key("password", "hash")
+        assert first._verify_cache_key("password", "hash") != second._verify_cache_key("password", "hash")
+
+    def test_verify_password_does_not_cache_failures(self):
+        """Test that failed verifications are always re-checked."""
+        auth_service = AuthService()
+        password_hash = auth_service.hash_password("cached_password_123")
+
+        with _spy_verify_secret() as mock_verify:
+            assert auth_service.verify_password("wrong_password", password_hash) is False
+            assert auth_service.verify_password("wrong_password", password_hash) is False
+
+        assert mock_verify.call_count == 2
+
+    def test_verify_password_cache_expires(self):
+        """Test that cached verifications expire after the TTL."""
+        auth_service = AuthService(cache_ttl_seconds=0)
+        password = "cached_password_123"
+        password_hash = auth_service.hash_password(password)
+
+        with _spy_verify_secret() as mock_verify:
+            assert auth_service.verify_password(password, password_hash) is True
+            assert auth_service.verify_password(password, password_hash) is True
+
+        assert mock_verify.call_count == 2
+
+    def test_verify_password_cache_evicts_least_recently_used(self):
+        """Test that the verification cache is bounded by maxsize."""
+        auth_service = AuthService(cache_maxsize=1)
+        first_hash = auth_service.hash_password("first_password")
+        second_hash = auth_service.hash_password("second_password")
+
+        auth_service.verify_password("first_password", first_hash)
+        auth_service.verify_password("second_password", second_hash)
+
+        assert len(auth_service._verify_cache) == 1
+        assert auth_service._verify_cache_key("second_password", second_hash) in auth_service._verify_cache
+
+    @pytest.mark.parametrize(
+        "password_hash",
+        [
+            pytest.param("", id="empty"),
+            pytest.param(None, id="none"),
+            pytest.param("not_a_valid_hash", id="no_argon2_prefix"),
+            pytest.param("$argon2id$v=19$m=19456,t=2,p=1$bad$bad", id="corrupt_salt_and_digest"),
+        ],
+    )
+    def test_verify_password_unusable_hash_runs_dummy_verify(self, auth_service, password_hash):
+        """Test that missing or malformed hashes still pay for a full Argon2 verify."""
+        with _spy_verify_secret() as mock_verify:
+            assert auth_service.verify_password("test_password_123", password_hash) is False
+
+        assert mock_verify.call_args.args[0] == auth_service_module._DUMMY_HASH
+
+    def test_verify_password_memoizes_hash_parsing(self, sample_hash):
+        """Test that hash parsing is memoized per parameter set, not per stored hash."""
+        auth_service = AuthService(cache_maxsize=0)
+        other_hash = auth_service.hash_password("other_password_123")
+        auth_service.verify_password("test_password_123", sample_hash)
+        info_before = auth_service_module._hash_type.cache_info()
+
+        assert auth_service.verify_password("test_password_123", sample_hash) is True
+        assert auth_service.verify_password("other_password_123", other_hash) is True
+
+        info_after = auth_service_module._hash_type.cache_info()
+        assert info_after.hits == info_before.hits + 2
+        assert info_after.currsize == info_before.currsize
+
+    def test_verify_password_unencodable_password_returns_false(self, auth_service, sample_hash):
+        """Test that a password with a lone surrogate is rejected rather than raising, at full Argon2 cost."""
+        with _spy_verify_secret() as mock_verify:
+            assert auth_service.verify_password("test_password_\ud800", sample_hash) is False
+
+        assert mock_verify.call_args.args[0] == auth_service_module._DUMMY_HASH
+
+    async def test_hash_password_async_round_trip(self, auth_service):
+        """Test that the async wrappers hash and verify like the sync methods."""
+        password_hash = await auth_service.hash_password_async("async_password_123")
+
+        assert password_hash.startswith("$argon2")
+        assert await auth_service.verify_password_async("async_password_123", password_hash) is True
+        assert await auth_service.verify_password_async("wrong_password", password_hash) is False
+
+    async def test_hash_password_async_empty_password_raises_error(self, auth_service):
+        """Test that the async wrapper propagates validation errors."""
+        with pytest.raises(ValueError, match="Password cannot be empty"):
+            await auth_service.hash_password_async("")
+
+    async def test_password_async_runs_off_event_loop(self, auth_service, sample_hash):
+        """Test that the async wrappers delegate to a worker thread."""
+        with patch.object(auth_service_module.asyncio, "to_thread", wraps=auth_service_module.asyncio.to_thread) as spy:
+            assert await auth_service.verify_password_async("test_password_123", sample_hash) is True
+
+        spy.assert_called_once_with(auth_service.verify_password, "test_password_123", sample_hash)
+
+    def test_verify_password_non_argon2_hash_skips_parsing(self, auth_service):
+        """Test that hashes without the $argon2 prefix are rejected before parsing."""
+        with patch.object(auth_service_module, "_hash_type") as mock_hash_type:
+            assert auth_service.verify_password("test_password_123", "$2b$12$notanargon2hash") is False
+
+        mock_hash_type.assert_not_called()
@@ -4,11 +4,14 @@ Unit tests for HydraAdminClient.
 Tests OAuth2 client management functionality with Hydra Admin API
 including CRUD operations, error handling, and health checks.
 """
+import asyncio
+
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 import httpx
+import orjson
 
-from src.services.hydra_client import HydraAdminClient
+from src.services.hydra_client import HydraAdminClient, get_hydra_admin_client
 
 
 class TestHydraAdminClient:
@@ -21,10 +24,36 @@ class TestHydraAdminClient:
             mock.hydra_admin_url = "http://hydra:4445"
             yield mock
 
+    @pytest.fixture(scope="module")
+    async def hydra_client(self):
+        """Create one HydraAdminClient instance shared by every test in the module."""
+        with patch('src.services.hydra_client.settings') as mock:
+            mock.hydra_admin_url = "http://hydra:4445"
+            client = HydraAdminClient()
+            yield client
+            await client.aclose()
+
     @pytest.fixture
-    def hydra_client(self, mock_settings):
-        """Create a HydraAdminClient instance."""
-        return HydraAdminClient()
+    def http_mocks(self, hydra_client, monkeypatch):
+        """Swap in mocked shared HTTP clients that all return one canned response.
+
+        Returns ``(mock_client_instance, mock_health_client, mock_response)``; tests
+        adjust ``mock_response`` inline rather than rebuilding the scaffolding.
+        """
+        mock_response = MagicMock(status_code=200)
+        mock_client_instance = AsyncMock(spec=httpx.AsyncClient)
+        mock_health_client = AsyncMock(spec=httpx.AsyncClient)
+        for method in (
+            mock_client_instance.get,
+            mock_client_instance.post,
+            mock_client_instance.put,
+            mock_client_instance.delete,
+            mock_health_client.get,
+        ):
+            method.return_value = mock_response
+        monkeypatch.setattr(hydra_client, "_client", mock_client_instance)
+        monkeypatch.setattr(hydra_client, "_health_client", mock_health_client)
+        return mock_client_instance, mock_health_client, mock_response
 
     @pytest.fixture
     def sample_client_data(self):
@@ -50,285 +79,225 @@ class TestHydraAdminClient:
             "updated_at": "2023-01-01T00:00:00Z"
         }
 
-    @patch('httpx.AsyncClient')
-    async def test_create_client_success(self, mock_async_client, hydra_client, 
+    async def test_create_client_success(self, hydra_client, http_mocks,
                                         sample_client_data, sample_client_response):
         """Test successful client creation."""
-        mock_response = MagicMock()
-        mock_response.raise_for_status.return_value = None
-        mock_response.json.return_value = sample_client_response
-        
-        mock_client_instance = AsyncMock()
-        mock_client_instance.post.return_value = mock_response
-        mock_async_client.return_value.__aenter__.return_value = mock_client_instance
-        
+        mock_client_instance, _, mock_response = http_mocks
+        mock_response.content = orjson.dumps(sample_client_response)
+
         result = await hydra_client.create_client(sample_client_data)
-        
+
         mock_client_instance.post.assert_called_once_with(
             "http://hydra:4445/admin/clients",
-            json=sample_client_data,
+            content=orjson.dumps(sample_client_data),
             headers={"Content-Type": "application/json"}
         )
         assert result == sample_client_response
 
-    @patch('httpx.AsyncClient')
-    async def test_create_client_http_error(self, mock_async_client, hydra_client, sample_client_data):
+    async def test_create_client_http_error(self, hydra_client, http_mocks, sample_client_data):
         """Test client creation with HTTP error."""
-        mock_response = MagicMock()
+        _, _, mock_response = http_mocks
         mock_response.status_code = 400
         mock_response.text = "Bad Request"
-        
-        mock_client_instance = AsyncMock()
-        mock_client_instance.post.return_value = mock_response
-        mock_client_instance.post.return_value.raise_for_status.side_effect = httpx.HTTPStatusError(
+        mock_response.raise_for_status.side_effect = httpx.HTTPStatusError(
             "Bad Request", request=MagicMock(), response=mock_response
         )
-        mock_async_client.return_value.__aenter__.return_value = mock_client_instance
-        
+
         with pytest.raises(httpx.HTTPStatusError):
             await hydra_client.create_client(sample_client_data)
 
-    @patch('httpx.AsyncClient')
-    async def test_create_client_generic_error(self, mock_async_client, hydra_client, sample_client_data):
+    async def test_create_client_generic_error(self, hydra_client, http_mocks, sample_client_data):
         """Test client creation with generic error."""
-        mock_client_instance = AsyncMock()
+        mock_client_instance, _, _ = http_mocks
         mock_client_instance.post.side_effect = Exception("Connection error")
-        mock_async_client.return_value.__aenter__.return_value = mock_client_instance
-        
+
         with pytest.raises(Exception, match="Connection error"):
             await hydra_client.create_client(sample_client_data)
 
-    @patch('httpx.AsyncClient')
-    async def test_get_client_success(self, mock_async_client, hydra_client, sample_client_response):
+    async def test_get_client_success(self, hydra_client, http_mocks, sample_client_response):
         """Test successful client retrieval."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.raise_for_status.return_value = None
-        mock_response.json.return_value = sample_client_response
-        
-        mock_client_instance = AsyncMock()
-        mock_client_instance.get.return_value = mock_response
-        mock_async_client.return_value.__aenter__.return_value = mock_client_instance
-        
+        mock_client_instance, _, mock_response = http_mocks
+        mock_response.content = orjson.dumps(sample_client_response)
+
         result = await hydra_client.get_client("test-client-id")
-        
+
         mock_client_instance.get.assert_called_once_with(
             "http://hydra:4445/admin/clients/test-client-id"
         )
         assert result == sample_client_response
 
-    @patch('httpx.AsyncClient')
-    async def test_get_client_not_found(self, mock_async_client, hydra_client):
+    async def test_get_client_not_found(self, hydra_client, http_mocks):
         """Test client retrieval when client not found."""
-        mock_response = MagicMock()
+        _, _, mock_response = http_mocks
         mock_response.status_code = 404
-        
-        mock_client_instance = AsyncMock()
-        mock_client_instance.get.return_value = mock_response
-        mock_async_client.return_value.__aenter__.return_value = mock_client_instance
-        
+
         result = await hydra_client.get_client("nonexistent-client")
-        
+
         assert result is None
 
-    @patch('httpx.AsyncClient')
-    async def test_get_client_http_error_not_404(self, mock_async_client, hydra_client):
+    async def test_get_client_http_error_not_404(self, hydra_client, http_mocks):
         """Test client retrieval with non-404 HTTP error."""
-        mock_response = MagicMock()
+        _, _, mock_response = http_mocks
         mock_response.status_code = 500
         mock_response.text = "Internal Server Error"
-        
-        mock_client_instance = AsyncMock()
-        mock_client_instance.get.return_value = mock_response
-        mock_client_instance.get.return_value.raise_for_status.side_effect = httpx.HTTPStatusError(
+        mock_response.raise_for_status.side_effect = httpx.HTTPStatusError(
             "Internal Server Error", request=MagicMock(), response=mock_response
         )
-        mock_async_client.return_value.__aenter__.return_value = mock_client_instance
-        
+
         with pytest.raises(httpx.HTTPStatusError):
             await hydra_client.get_client("test-client-id")
 
-    @patch('httpx.AsyncClient')
-    async def test_update_client_success(self, mock_async_client, hydra_client, 
+    async def test_get_clients_bulk_parallel(self, hydra_client, http_mocks, sample_client_response):
+        """Test that bulk retrieval issues all GETs concurrently."""
+        mock_client_instance, _, mock_response = http_mocks
+        mock_response.content = orjson.dumps(sample_client_response)
+
+        in_flight = 0
+        max_in_flight = 0
+
+        async def fake_get(url):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return mock_response
+
+        mock_client_instance.get.side_effect = fake_get
+        client_ids = ["client-a", "client-b", "client-c"]
+
+        result = await hydra_client.get_clients(client_ids)
+
+        assert result == [sample_client_response] * 3
+        assert max_in_flight == 3
+        assert [c.args[0] for c in mock_client_instance.get.await_args_list] == [
+            f"http://hydra:4445/admin/clients/{client_id}" for client_id in client_ids
+        ]
+
+    async def test_update_client_success(self, hydra_client, http_mocks,
                                         sample_client_data, sample_client_response):
         """Test successful client update."""
-        mock_response = MagicMock()
-        mock_response.raise_for_status.return_value = None
-        mock_response.json.return_value = sample_client_response
-        
-        mock_client_instance = AsyncMock()
-        mock_client_instance.put.return_value = mock_response
-        mock_async_client.return_value.__aenter__.return_value = mock_client_instance
-        
+        mock_client_instance, _, mock_response = http_mocks
+        mock_response.content = orjson.dumps(sample_client_response)
+
         result = await hydra_client.update_client("test-client-id", sample_client_data)
-        
+
         mock_client_instance.put.assert_called_once_with(
             "http://hydra:4445/admin/clients/test-client-id",
-            json=sample_client_data,
+            content=orjson.dumps(sample_client_data),
             headers={"Content-Type": "application/json"}
         )
         assert result == sample_client_response
 
-    @patch('httpx.AsyncClient')
-    async def test_update_client_http_error(self, mock_async_client, hydra_client, sample_client_data):
+    async def test_update_client_http_error(self, hydra_client, http_mocks, sample_client_data):
         """Test client update with HTTP error."""
-        mock_response = MagicMock()
+        _, _, mock_response = http_mocks
         mock_response.status_code = 404
         mock_response.text = "Not Found"
-        
-        mock_client_instance = AsyncMock()
-        mock_client_instance.put.return_value = mock_response
-        mock_client_instance.put.return_value.raise_for_status.side_effect = httpx.HTTPStatusError(
+        mock_response.raise_for_status.side_effect = httpx.HTTPStatusError(
             "Not Found", request=MagicMock(), response=mock_response
         )
-        mock_async_client.return_value.__aenter__.return_value = mock_client_instance
-        
+
         with pytest.raises(httpx.HTTPStatusError):
             await hydra_client.update_client("nonexistent-client", sample_client_data)
 
-    @patch('httpx.AsyncClient')
-    async def test_delete_client_success(self, mock_async_client, hydra_client):
+    async def test_delete_client_success(self, hydra_client, http_mocks):
         """Test successful client deletion."""
-        mock_response = MagicMock()
+        mock_client_instance, _, mock_response = http_mocks
         mock_response.status_code = 204
-        mock_response.raise_for_status.return_value = None
-        
-        mock_client_instance = AsyncMock()
-        mock_client_instance.delete.return_value = mock_response
-        mock_async_client.return_value.__aenter__.return_value = mock_client_instance
-        
+
         result = await hydra_client.delete_client("test-client-id")
-        
+
         mock_client_instance.delete.assert_called_once_with(
             "http://hydra:4445/admin/clients/test-client-id"
         )
         assert result is True
 
-    @patch('httpx.AsyncClient')
-    async def test_delete_client_not_found(self, mock_async_client, hydra_client):
+    async def test_delete_client_not_found(self, hydra_client, http_mocks):
         """Test client deletion when client not found."""
-        mock_response = MagicMock()
+        _, _, mock_response = http_mocks
         mock_response.status_code = 404
-        
-        mock_client_instance = AsyncMock()
-        mock_client_instance.delete.return_value = mock_response
-        mock_async_client.return_value.__aenter__.return_value = mock_client_instance
-        
+
         result = await hydra_client.delete_client("nonexistent-client")
-        
+
         assert result is True  # Consider 404 as successful deletion
 
-    @patch('httpx.AsyncClient')
-    async def test_delete_client_http_error_not_404(self, mock_async_client, hydra_client):
+    async def test_delete_client_http_error_not_404(self, hydra_client, http_mocks):
         """Test client deletion with non-404 HTTP error."""
-        mock_response = MagicMock()
+        _, _, mock_response = http_mocks
         mock_response.status_code = 500
         mock_response.text = "Internal Server Error"
-        
-        mock_client_instance = AsyncMock()
-        mock_client_instance.delete.return_value = mock_response
-        mock_client_instance.delete.return_value.raise_for_status.side_effect = httpx.HTTPStatusError(
+        mock_response.raise_for_status.side_effect = httpx.HTTPStatusError(
             "Internal Server Error", request=MagicMock(), response=mock_response
         )
-        mock_async_client.return_value.__aenter__.return_value = mock_client_instance
-        
+
         with pytest.raises(httpx.HTTPStatusError):
             await hydra_client.delete_client("test-client-id")
 
-    @patch('httpx.AsyncClient')
-    async def test_list_clients_success(self, mock_async_client, hydra_client, sample_client_response):
+    async def test_list_clients_success(self, hydra_client, http_mocks, sample_client_response):
         """Test successful client listing."""
+        mock_client_instance, _, mock_response = http_mocks
         clients_list = [sample_client_response]
-        mock_response = MagicMock()
-        mock_response.raise_for_status.return_value = None
-        mock_response.json.return_value = clients_list
-        
-        mock_client_instance = AsyncMock()
-        mock_client_instance.get.return_value = mock_response
-        mock_async_client.return_value.__aenter__.return_value = mock_client_instance
-        
+        mock_response.content = orjson.dumps(clients_list)
+
         result = await hydra_client.list_clients()
-        
+
         mock_client_instance.get.assert_called_once_with(
             "http://hydra:4445/admin/clients",
             params={"limit": 100, "offset": 0}
         )
         assert result == clients_list
 
-    @patch('httpx.AsyncClient')
-    async def test_list_clients_with_params(self, mock_async_client, hydra_client):
+    async def test_list_clients_with_params(self, hydra_client, http_mocks):
         """Test client listing with custom parameters."""
-        mock_response = MagicMock()
-        mock_response.raise_for_status.return_value = None
-        mock_response.json.return_value = []
-        
-        mock_client_instance = AsyncMock()
-        mock_client_instance.get.return_value = mock_response
-        mock_async_client.return_value.__aenter__.return_value = mock_client_instance
-        
+        mock_client_instance, _, mock_response = http_mocks
+        mock_response.content = orjson.dumps([])
+
         result = await hydra_client.list_clients(limit=50, offset=10)
-        
+
         mock_client_instance.get.assert_called_once_with(
             "http://hydra:4445/admin/clients",
             params={"limit": 50, "offset": 10}
         )
         assert result == []
 
-    @patch('httpx.AsyncClient')
-    async def test_list_clients_http_error(self, mock_async_client, hydra_client):
+    async def test_list_clients_http_error(self, hydra_client, http_mocks):
         """Test client listing with HTTP error."""
-        mock_response = MagicMock()
+        _, _, mock_response = http_mocks
         mock_response.status_code = 500
         mock_response.text = "Internal Server Error"
-        
-        mock_client_instance = AsyncMock()
-        mock_client_instance.get.return_value = mock_response
-        mock_client_instance.get.return_value.raise_for_status.side_effect = httpx.HTTPStatusError(
+        mock_response.raise_for_status.side_effect = httpx.HTTPStatusError(
             "Internal Server Error", request=MagicMock(), response=mock_response
         )
-        mock_async_client.return_value.__aenter__.return_value = mock_client_instance
-        
+
         with pytest.raises(httpx.HTTPStatusError):
             await hydra_client.list_clients()
 
-    @patch('httpx.AsyncClient')
-    async def test_health_check_success(self, mock_async_client, hydra_client):
+    async def test_health_check_success(self, hydra_client, http_mocks):
         """Test successful health check."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        
-        mock_client_instance = AsyncMock()
-        mock_client_instance.get.return_value = mock_response
-        mock_async_client.return_value.__aenter__.return_value = mock_client_instance
-        
+        _, mock_health_client, _ = http_mocks
+
         result = await hydra_client.health_check()
-        
-        mock_client_instance.get.assert_called_once_with("http://hydra:4445/health/ready")
+
+        mock_health_client.get.assert_called_once_with("http://hydra:4445/health/ready")
         assert result is True
 
-    @patch('httpx.AsyncClient')
-    async def test_health_check_failure(self, mock_async_client, hydra_client):
+    async def test_health_check_failure(self, hydra_client, http_mocks):
         """Test health check failure."""
-        mock_response = MagicMock()
+        _, _, mock_response = http_mocks
         mock_response.status_code = 503
-        
-        mock_client_instance = AsyncMock()
-        mock_client_instance.get.return_value = mock_response
-        mock_async_client.return_value.__aenter__.return_value = mock_client_instance
-        
+
         result = await hydra_client.health_check()
-        
+
         assert result is False
 
-    @patch('httpx.AsyncClient')
-    async def test_health_check_exception(self, mock_async_client, hydra_client):
+    async def test_health_check_exception(self, hydra_client, http_mocks):
         """Test health check with exception."""
-        mock_client_instance = AsyncMock()
-        mock_client_instance.get.side_effect = Exception("Connection failed")
-        mock_async_client.return_value.__aenter__.return_value = mock_client_instance
-        
+        _, mock_health_client, _ = http_mocks
+        mock_health_client.get.side_effect = Exception("Connection failed")
+
         result = await hydra_client.health_check()
-        
+
         assert result is False
 
     def test_init_sets_correct_attributes(self, hydra_client, mock_settings):
@@ -336,65 +305,76 @@ class TestHydraAdminClient:
         assert hydra_client.base_url == "http://hydra:4445"
         assert hydra_client.timeout == 30.0
 
-    @patch('httpx.AsyncClient')
-    async def test_timeout_configuration(self, mock_async_client, hydra_client):
-        """Test that timeout is properly configured for HTTP client."""
-        mock_client_instance = AsyncMock()
-        mock_async_client.return_value.__aenter__.return_value = mock_client_instance
-        
-        await hydra_client.create_client({"client_id": "test"})
-        
-        # Verify AsyncClient was called with correct timeout
-        mock_async_client.assert_called_with(timeout=30.0)
-
-    @patch('httpx.AsyncClient')
-    async def test_health_check_timeout_configuration(self, mock_async_client, hydra_client):
+    def test_timeout_configuration(self, hydra_client):
+        """Test that timeout is properly configured for the shared HTTP client."""
+        assert hydra_client._client.timeout == httpx.Timeout(30.0)
+
+    def test_health_check_timeout_configuration(self, hydra_client):
         """Test that health check uses shorter timeout."""
-        mock_client_instance = AsyncMock()
-        mock_client_instance.get.return_value.status_code = 200
-        mock_async_client.return_value.__aenter__.return_value = mock_client_instance
-        
-        await hydra_client.health_check()
-        
-        # Verify AsyncClient was called with shorter timeout for health check
-        mock_async_client.assert_called_with(timeout=5.0)
-
-    @patch('httpx.AsyncClient')
-    async def test_get_client_generic_error(self, mock_async_client, hydra_client):
+        assert hydra_client._health_client.timeout == httpx.Timeout(5.0)
+
+    @pytest.mark.parametrize(
+        "admin_url, http2",
+        [
+            pytest.param("http://hydra:4445", False, id="plain_http"),
+            pytest.param("https://hydra:4445", True, id="tls"),
+        ],
+    )
+    def test_http2_only_requested_over_tls(self, mock_settings, admin_url, http2):
+        """Test that HTTP/2 is only requested when it can be negotiated via TLS ALPN."""
+        mock_settings.hydra_admin_url = admin_url
+        with patch('src.services.hydra_client.httpx.AsyncClient') as mock_client_cls:
+            HydraAdminClient()
+
+        assert mock_client_cls.call_args_list[0].kwargs["http2"] is http2
+
+    async def test_get_hydra_admin_client_is_shared(self, mock_settings):
+        """Test that the dependency helper hands out one shared client."""
+        get_hydra_admin_client.cache_clear()
+        client = get_hydra_admin_client()
+        try:
+            assert get_hydra_admin_client() is client
+        finally:
+            await client.aclose()
+            get_hydra_admin_client.cache_clear()
+
+    async def test_aclose_closes_http_clients(self, hydra_client, http_mocks):
+        """Test that aclose closes both underlying HTTP clients."""
+        mock_client_instance, mock_health_client, _ = http_mocks
+
+        await hydra_client.aclose()
+
+        mock_client_instance.aclose.assert_awaited_once()
+        mock_health_client.aclose.assert_awaited_once()
+
+    async def test_get_client_generic_error(self, hydra_client, http_mocks):
         """Test client retrieval with generic error."""
-        mock_client_instance = AsyncMock()
+        mock_client_instance, _, _ = http_mocks
         mock_client_instance.get.side_effect = Exception("Network error")
-        mock_async_client.return_value.__aenter__.return_value = mock_client_instance
-        
+
         with pytest.raises(Exception, match="Network error"):
             await hydra_client.get_client("test-client-id")
 
-    @patch('httpx.AsyncClient')
-    async def test_update_client_generic_error(self, mock_async_client, hydra_client, sample_client_data):
+    async def test_update_client_generic_error(self, hydra_client, http_mocks, sample_client_data):
         """Test client update with generic error."""
-        mock_client_instance = AsyncMock()
+        mock_client_instance, _, _ = http_mocks
         mock_client_instance.put.side_effect = Exception("Connection timeout")
-        mock_async_client.return_value.__aenter__.return_value = mock_client_instance
-        
+
         with pytest.raises(Exception, match="Connection timeout"):
             await hydra_client.update_client("test-client-id", sample_client_data)
 
-    @patch('httpx.AsyncClient')
-    async def test_delete_client_generic_error(self, mock_async_client, hydra_client):
+    async def test_delete_client_generic_error(self, hydra_client, http_mocks):
         """Test client deletion with generic error."""
-        mock_client_instance = AsyncMock()
+        mock_client_instance, _, _ = http_mocks
         mock_client_instance.delete.side_effect = Exception("Server error")
-        mock_async_client.return_value.__aenter__.return_value = mock_client_instance
-        
+
         with pytest.raises(Exception, match="Server error"):
             await hydra_client.delete_client("test-client-id")
 
-    @patch('httpx.AsyncClient')
-    async def test_list_clients_generic_error(self, mock_async_client, hydra_client):
+    async def test_list_clients_generic_error(self, hydra_client, http_mocks):
         """Test client listing with generic error."""
-        mock_client_instance = AsyncMock()
+        mock_client_instance, _, _ = http_mocks
         mock_client_instance.get.side_effect = Exception("DNS resolution failed")
-        mock_async_client.return_value.__aenter__.return_value = mock_client_instance
-        
+
         with pytest.raises(Exception, match="DNS resolution failed"):
             await hydra_client.list_clients()
@@ -4,10 +4,12 @@ Unit tests for RoleService.
 Tests role management functionality including CRUD operations,
 user associations, and audit logging.
 """
+import re
+
 import pytest
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, call
 from datetime import datetime
-from uuid import uuid4
+from uuid import UUID
 
 from src.services.role_service import RoleService
 from src.models.role import Role
@@ -15,253 +17,246 @@ from src.models.user import User
 from src.schemas.role import RoleCreate, RoleUpdate
 
 
-class TestRoleService:
-    """Test suite for RoleService operations."""
+# Deterministic timestamps and IDs for the sample models
+_FIXED_NOW = datetime(2024, 1, 1)
+_FIXED_ROLE_ID = UUID("00000000-0000-0000-0000-000000000001")
+_FIXED_USER_ID = UUID("00000000-0000-0000-0000-000000000002")
+_FIXED_OTHER_ROLE_ID = UUID("00000000-0000-0000-0000-000000000003")
 
-    @pytest.fixture
-    def mock_role_repo(self):
-        """Create mock RoleRepository."""
-        return AsyncMock()
-
-    @pytest.fixture
-    def mock_user_repo(self):
-        """Create mock UserRepository."""
-        return AsyncMock()
-
-    @pytest.fixture
-    def mock_audit_repo(self):
-        """Create mock AuditLogRepository."""
-        return AsyncMock()
-
-    @pytest.fixture
-    def mock_service_account_repo(self):
-        """Create mock ServiceAccountRepository."""
-        return AsyncMock()
-
-    @pytest.fixture
-    def role_service(self, mock_role_repo, mock_user_repo, mock_service_account_repo, mock_audit_repo):
-        """Create RoleService instance with mocked dependencies."""
-        return RoleService(mock_role_repo, mock_user_repo, mock_service_account_repo, mock_audit_repo)
-
-    @pytest.fixture
-    def sample_role(self):
-        """Create sample Role model."""
-        role_id = uuid4()
-        user_id = uuid4()
-        user = User(
-            id=user_id,
-            email="test@example.com",
-            display_name="Test User",
-            password_hash="hashed_password",
-            is_active=True,
-            failed_login_attempts=0,
-            created_at=datetime.utcnow(),
-            updated_at=datetime.utcnow(),
-            roles=[]
-        )
-        return Role(
-            id=role_id,
-            name="admin",
-            description="Administrator role",
-            created_at=datetime.utcnow(),
-            updated_at=datetime.utcnow(),
-            users=[user]
-        )
+_ROLE_EXISTS_RE = re.compile(r"Role with name .* already exists")
 
-    @pytest.fixture
-    def sample_role_create(self):
-        """Create sample RoleCreate schema."""
-        return RoleCreate(
-            name="new_role",
-            description="New role for testing"
-        )
+# Schema inputs are immutable, so validate them once at import
+_SAMPLE_ROLE_CREATE = RoleCreate(
+    name="new_role",
+    description="New role for testing"
+)
+_SAMPLE_ROLE_UPDATE = RoleUpdate(
+    name="updated_role",
+    description="Updated description"
+)
 
-    @pytest.fixture
-    def sample_role_update(self):
-        """Create sample RoleUpdate schema."""
-        return RoleUpdate(
-            name="updated_role",
-            description="Updated description"
-        )
 
-    async def test_get_all_roles_success(self, role_service, mock_role_repo, sample_role):
+@pytest.fixture(scope="session")
+def role_service(role_repo, user_repo, service_account_repo, audit_repo):
+    """Create RoleService instance with mocked dependencies."""
+    return RoleService(role_repo, user_repo, service_account_repo, audit_repo)
+
+
+@pytest.fixture
+def log_action_mock(role_service, monkeypatch):
+    """Replace the service's audit logging with an AsyncMock for this test."""
+    mock = AsyncMock()
+    monkeypatch.setattr(role_service, "_log_action", mock)
+    return mock
+
+
+@pytest.fixture(scope="session")
+def sample_role_bare():
+    """Create sample Role model without any users."""
+    return Role(
+        id=_FIXED_ROLE_ID,
+        name="admin",
+        description="Administrator role",
+        created_at=_FIXED_NOW,
+        updated_at=_FIXED_NOW,
+        users=[]
+    )
+
+
+@pytest.fixture(scope="session")
+def sample_role_with_user():
+    """Create sample Role model with one assigned user."""
+    user = User(
+        id=_FIXED_USER_ID,
+        email="test@example.com",
+        display_name="Test User",
+        password_hash="hashed_password",
+        is_active=True,
+        failed_login_attempts=0,
+        created_at=_FIXED_NOW,
+        updated_at=_FIXED_NOW,
+        roles=[]
+    )
+    return Role(
+        id=_FIXED_ROLE_ID,
+        name="admin",
+        description="Administrator role",
+        created_at=_FIXED_NOW,
+        updated_at=_FIXED_NOW,
+        users=[user]
+    )
+
+
+@pytest.fixture(scope="session")
+def sample_role_create():
+    """Create sample RoleCreate schema."""
+    return _SAMPLE_ROLE_CREATE
+
+
+@pytest.fixture(scope="session")
+def sample_role_update():
+    """Create sample RoleUpdate schema."""
+    return _SAMPLE_ROLE_UPDATE
+
+
+class TestRoleService:
+    """Test suite for RoleService operations."""
+
+    async def test_get_all_roles_success(self, role_service, role_repo, sample_role_with_user):
         """Test successful retrieval of all roles."""
-        mock_role_repo.get_all_with_users.return_value = [sample_role]
+        role_repo.get_all_with_users.return_value = [sample_role_with_user]
         
         result = await role_service.get_all_roles(skip=0, limit=100)
         
-        mock_role_repo.get_all_with_users.assert_called_once_with(0, 100)
+        assert role_repo.get_all_with_users.call_args_list == [call(0, 100)]
         assert len(result) == 1
         assert result[0].name == "admin"
         assert result[0].description == "Administrator role"
 
-    async def test_get_all_roles_empty(self, role_service, mock_role_repo):
+    async def test_get_all_roles_empty(self, role_service, role_repo):
         """Test retrieval when no roles exist."""
-        mock_role_repo.get_all_with_users.return_value = []
+        role_repo.get_all_with_users.return_value = []
         
         result = await role_service.get_all_roles()
         
         assert result == []
 
-    async def test_get_role_by_id_success(self, role_service, mock_role_repo, sample_role):
-        """Test successful role retrieval by ID."""
-        role_id = str(sample_role.id)
-        mock_role_repo.get_by_id_with_users.return_value = sample_role
+    @pytest.mark.parametrize(
+        "role_found",
+        [pytest.param(True, id="success"), pytest.param(False, id="not_found")],
+    )
+    async def test_get_role_by_id(self, role_service, role_repo, sample_role_with_user, role_found):
+        """Test role retrieval by ID when the role exists and when it does not."""
+        role_id = str(sample_role_with_user.id)
+        role_repo.get_by_id_with_users.return_value = sample_role_with_user if role_found else None
         
         result = await role_service.get_role_by_id(role_id)
         
-        mock_role_repo.get_by_id_with_users.assert_called_once_with(role_id)
-        assert result is not None
-        assert result.name == "admin"
-
-    async def test_get_role_by_id_not_found(self, role_service, mock_role_repo):
-        """Test role retrieval when role not found."""
-        mock_role_repo.get_by_id_with_users.return_value = None
-        
-        result = await role_service.get_role_by_id("nonexistent-id")
-        
-        assert result is None
+        assert role_repo.get_by_id_with_users.call_args_list == [call(role_id)]
+        if role_found:
+            assert result is not None
+            assert result.name == "admin"
+        else:
+            assert result is None
 
-    async def test_create_role_success(self, role_service, mock_role_repo, 
-                                     sample_role_create, sample_role):
+    async def test_create_role_success(self, role_service, log_action_mock, role_repo, 
+                                     sample_role_create, sample_role_bare):
         """Test successful role creation."""
-        mock_role_repo.get_by_name.return_value = None
-        mock_role_repo.create.return_value = sample_role
+        role_repo.get_by_name.return_value = None
+        role_repo.create.return_value = sample_role_bare
         
-        with patch.object(role_service, '_log_action') as mock_log:
-            result = await role_service.create_role(sample_role_create, "admin")
+        result = await role_service.create_role(sample_role_create, "admin")
         
-        mock_role_repo.get_by_name.assert_called_once_with(sample_role_create.name)
-        mock_role_repo.create.assert_called_once()
-        mock_log.assert_called_once()
-        assert result.name == sample_role.name
+        assert role_repo.get_by_name.call_args_list == [call(sample_role_create.name)]
+        assert role_repo.create.call_count == 1
+        assert log_action_mock.call_count == 1
+        assert result.name == sample_role_bare.name
 
-    async def test_create_role_already_exists(self, role_service, mock_role_repo, 
-                                            sample_role_create, sample_role):
+    async def test_create_role_already_exists(self, role_service, role_repo, 
+                                            sample_role_create, sample_role_bare):
         """Test role creation when name already exists."""
-        mock_role_repo.get_by_name.return_value = sample_role
+        role_repo.get_by_name.return_value = sample_role_bare
         
-        with pytest.raises(ValueError, match="Role with name .* already exists"):
+        with pytest.raises(ValueError, match=_ROLE_EXISTS_RE):
             await role_service.create_role(sample_role_create, "admin")
 
-    async def test_update_role_success(self, role_service, mock_role_repo, 
-                                     sample_role, sample_role_update):
+    async def test_update_role_success(self, role_service, log_action_mock, role_repo, 
+                                     sample_role_bare, sample_role_update):
         """Test successful role update."""
-        role_id = str(sample_role.id)
-        mock_role_repo.get_by_id_with_users.return_value = sample_role
-        mock_role_repo.get_by_name.return_value = None  # Name doesn't exist
-        mock_role_repo.update.return_value = sample_role
+        role_id = str(sample_role_bare.id)
+        role_repo.get_by_id_with_users.return_value = sample_role_bare
+        role_repo.get_by_name.return_value = None  # Name doesn't exist
+        role_repo.update.return_value = sample_role_bare
         
-        with patch.object(role_service, '_log_action') as mock_log:
-            result = await role_service.update_role(role_id, sample_role_update, "admin")
+        result = await role_service.update_role(role_id, sample_role_update, "admin")
         
-        mock_role_repo.update.assert_called_once()
-        mock_log.assert_called_once()
-        assert result.name == sample_role.name
+        assert role_repo.update.call_count == 1
+        assert log_action_mock.call_count == 1
+        assert result.name == sample_role_bare.name
 
-    async def test_update_role_not_found(self, role_service, mock_role_repo, sample_role_update):
+    async def test_update_role_not_found(self, role_service, role_repo, sample_role_update):
         """Test role update when role not found."""
-        mock_role_repo.get_by_id_with_users.return_value = None
+        role_repo.get_by_id_with_users.return_value = None
         
         result = await role_service.update_role("nonexistent-id", sample_role_update, "admin")
         
         assert result is None
 
-    async def test_update_role_name_exists(self, role_service, mock_role_repo, 
-                                         sample_role, sample_role_update):
+    async def test_update_role_name_exists(self, role_service, role_repo, 
+                                         sample_role_bare, sample_role_update):
         """Test role update when new name already exists."""
-        role_id = str(sample_role.id)
-        existing_role = Role(id=uuid4(), name="existing", description="Existing role",
-                           created_at=datetime.utcnow(), updated_at=datetime.utcnow())
+        role_id = str(sample_role_bare.id)
+        existing_role = Role(id=_FIXED_OTHER_ROLE_ID, name="existing", description="Existing role",
+                           created_at=_FIXED_NOW, updated_at=_FIXED_NOW)
         
-        mock_role_repo.get_by_id_with_users.return_value = sample_role
-        mock_role_repo.get_by_name.return_value = existing_role
+        role_repo.get_by_id_with_users.return_value = sample_role_bare
+        role_repo.get_by_name.return_value = existing_role
         
-        with pytest.raises(ValueError, match="Role with name .* already exists"):
+        with pytest.raises(ValueError, match=_ROLE_EXISTS_RE):
             await role_service.update_role(role_id, sample_role_update, "admin")
 
-    async def test_delete_role_success(self, role_service, mock_role_repo, sample_role):
-        """Test successful role deletion."""
-        role_id = str(sample_role.id)
-        mock_role_repo.get_by_id.return_value = sample_role
-        mock_role_repo.delete.return_value = True
-        
-        with patch.object(role_service, '_log_action') as mock_log:
-            result = await role_service.delete_role(role_id, "admin")
-        
-        mock_role_repo.delete.assert_called_once_with(role_id)
-        mock_log.assert_called_once()
-        assert result is True
-
-    async def test_delete_role_not_found(self, role_service, mock_role_repo):
-        """Test role deletion when role not found."""
-        mock_role_repo.get_by_id.return_value = None
-        
-        result = await role_service.delete_role("nonexistent-id", "admin")
-        
-        assert result is False
-
-    async def test_delete_role_failure(self, role_service, mock_role_repo, sample_role):
-        """Test role deletion failure."""
-        role_id = str(sample_role.id)
-        mock_role_repo.get_by_id.return_value = sample_role
-        mock_role_repo.delete.return_value = False
+    @pytest.mark.parametrize(
+        "role_found, deleted, expected",
+        [
+            pytest.param(True, True, True, id="success"),
+            pytest.param(False, True, False, id="not_found"),
+            pytest.param(True, False, False, id="failure"),
+        ],
+    )
+    async def test_delete_role(self, role_service, log_action_mock, role_repo, sample_role_bare,
+                               role_found, deleted, expected):
+        """Test role deletion success, missing role, and repository failure."""
+        role_id = str(sample_role_bare.id)
+        role_repo.get_by_id.return_value = sample_role_bare if role_found else None
+        role_repo.delete.return_value = deleted
         
         result = await role_service.delete_role(role_id, "admin")
         
-        assert result is False
+        assert result is expected
+        assert role_repo.delete.called is role_found
+        assert log_action_mock.called is expected
 
-    async def test_assign_user_to_role_success(self, role_service, mock_user_repo, mock_role_repo):
-        """Test successful user assignment to role."""
+    @pytest.mark.parametrize(
+        "assign_role_result",
+        [pytest.param(True, id="success"), pytest.param(False, id="failure")],
+    )
+    async def test_assign_user_to_role(self, role_service, log_action_mock, user_repo, assign_role_result):
+        """Test user assignment to role, logging only on success."""
         user_id = "user-123"
         role_id = "role-456"
-        mock_user_repo.assign_role.return_value = True
-        
-        with patch.object(role_service, '_log_action') as mock_log:
-            result = await role_service.assign_user_to_role(user_id, role_id, "admin")
-        
-        mock_user_repo.assign_role.assert_called_once_with(user_id, role_id)
-        mock_log.assert_called_once()
-        assert result is True
-
-    async def test_assign_user_to_role_failure(self, role_service, mock_user_repo):
-        """Test user assignment to role failure."""
-        mock_user_repo.assign_role.return_value = False
+        user_repo.assign_role.return_value = assign_role_result
         
-        result = await role_service.assign_user_to_role("user-id", "role-id", "admin")
+        result = await role_service.assign_user_to_role(user_id, role_id, "admin")
         
-        assert result is False
+        assert user_repo.assign_role.call_args_list == [call(user_id, role_id)]
+        assert log_action_mock.called is assign_role_result
+        assert result is assign_role_result
 
-    async def test_remove_user_from_role_success(self, role_service, mock_user_repo, mock_role_repo):
-        """Test successful user removal from role."""
+    @pytest.mark.parametrize(
+        "remove_role_result",
+        [pytest.param(True, id="success"), pytest.param(False, id="failure")],
+    )
+    async def test_remove_user_from_role(self, role_service, log_action_mock, user_repo, remove_role_result):
+        """Test user removal from role, logging only on success."""
         user_id = "user-123"
         role_id = "role-456"
-        mock_user_repo.remove_role.return_value = True
+        user_repo.remove_role.return_value = remove_role_result
         
-        with patch.object(role_service, '_log_action') as mock_log:
-            result = await role_service.remove_user_from_role(user_id, role_id, "admin")
+        result = await role_service.remove_user_from_role(user_id, role_id, "admin")
         
-        mock_user_repo.remove_role.assert_called_once_with(user_id, role_id)
-        mock_log.assert_called_once()
-        assert result is True
+        assert user_repo.remove_role.call_args_list == [call(user_id, role_id)]
+        assert log_action_mock.called is remove_role_result
+        assert result is remove_role_result
 
-    async def test_remove_user_from_role_failure(self, role_service, mock_user_repo):
-        """Test user removal from role failure."""
-        mock_user_repo.remove_role.return_value = False
-        
-        result = await role_service.remove_user_from_role("user-id", "role-id", "admin")
-        
-        assert result is False
-
-    def test_role_to_response_conversion(self, role_service, sample_role):
+    def test_role_to_response_conversion(self, role_service, sample_role_with_user):
         """Test role model to response schema conversion."""
-        result = role_service._role_to_response(sample_role)
+        result = role_service._role_to_response(sample_role_with_user)
         
-        assert result.name == sample_role.name
-        assert result.description == sample_role.description
-        assert result.user_count == sample_role.user_count
+        assert result.name == sample_role_with_user.name
+        assert result.description == sample_role_with_user.description
+        assert result.user_count == sample_role_with_user.user_count
 
-    async def test_log_action(self, role_service, mock_audit_repo):
+    async def test_log_action(self, role_service, audit_repo):
         """Test audit log action logging."""
         await role_service._log_action(
             action="test_action",
@@ -271,7 +266,7 @@ class TestRoleService:
             performed_by="admin"
         )
         
-        mock_audit_repo.create_with_serialization.assert_called_once_with(
+        assert audit_repo.create_with_serialization.call_args_list == [call(
             action="test_action",
             resource_type="role",
             resource_id="role-123",
@@ -279,4 +274,4 @@ class TestRoleService:
             performed_by="admin",
             ip_address=None,
             user_agent=None
-        )
+        )]
@@ -1,10 +1,11 @@
 """
 Unit tests for ServiceAccountService business logic.
 """
+from contextlib import nullcontext
+
 import pytest
-from unittest.mock import AsyncMock, MagicMock
-from uuid import uuid4
-from src.services.service_account_service import ServiceAccountService
+from unittest.mock import MagicMock
+from uuid import UUID
 from src.core.exceptions import (
     ServiceAccountNotFoundError,
     ServiceAccountAlreadyExistsError,
@@ -12,98 +13,53 @@ from src.core.exceptions import (
     HydraIntegrationError
 )
 
-@pytest.fixture
-def service_account_repo():
-    repo = MagicMock()
-    repo.get_by_client_id = AsyncMock()
-    repo.create = AsyncMock()
-    repo.get_by_id_with_roles = AsyncMock()
-    repo.get_by_id = AsyncMock()
-    repo.update = AsyncMock()
-    repo.delete = AsyncMock()
-    repo.delete_service_account_with_roles_and_scopes = AsyncMock()
-    repo.search = AsyncMock()
-    repo.assign_role = AsyncMock()
-    repo.remove_role = AsyncMock()
-    repo.activate = AsyncMock()
-    repo.deactivate = AsyncMock()
-    return repo
-
-@pytest.fixture
-def role_repo():
-    repo = MagicMock()
-    repo.get_by_id = AsyncMock()
-    return repo
-
-@pytest.fixture
-def hydra_client():
-    client = MagicMock()
-    client.create_client = AsyncMock()
-    client.update_client = AsyncMock()
-    client.delete_client = AsyncMock()
-    client.get_client = AsyncMock()
-    return client
+pytestmark = pytest.mark.asyncio(loop_scope="module")
 
-@pytest.fixture
-def service(service_account_repo, role_repo, hydra_client):
-    return ServiceAccountService(service_account_repo, role_repo, hydra_client)
+_ROLE_ID = UUID("00000000-0000-0000-0000-000000000100")
 
-def make_service_account(**kwargs):
-    mock = MagicMock()
-    mock.id = kwargs.get('id', uuid4())
-    mock.client_id = kwargs.get('client_id', 'svc-123')
-    mock.to_hydra_client = MagicMock(return_value={"client_id": mock.client_id})
-    mock.roles = kwargs.get('roles', [])
-    return mock
-
-@pytest.mark.asyncio
-async def test_create_service_account_success(service, service_account_repo, hydra_client):
-    data = {"client_id": "svc-abc"}
-    service_account_repo.get_by_client_id.return_value = None
-    created = make_service_account(client_id="svc-abc")
+@pytest.mark.parametrize(
+    "client_id, exists, hydra_exc, expected_exc",
+    [
+        pytest.param("svc-abc", False, None, None, id="success"),
+        pytest.param("svc-dup", True, None, ServiceAccountAlreadyExistsError, id="already_exists"),
+        pytest.param("svc-fail", False, Exception("hydra error"), HydraIntegrationError, id="hydra_failure"),
+    ],
+)
+async def test_create_service_account(service, make_service_account, service_account_repo, hydra_client,
+                                      client_id, exists, hydra_exc, expected_exc):
+    created = make_service_account(client_id=client_id)
+    service_account_repo.get_by_client_id.return_value = created if exists else None
     service_account_repo.create.return_value = created
     service_account_repo.get_by_id.return_value = created  # This is what the service actually calls
-    hydra_client.create_client.return_value = None
-
-    result = await service.create_service_account(data)
-    assert result.client_id == "svc-abc"
-    hydra_client.create_client.assert_called_once()
-
-@pytest.mark.asyncio
-async def test_create_service_account_already_exists(service, service_account_repo):
-    data = {"client_id": "svc-dup"}
-    service_account_repo.get_by_client_id.return_value = make_service_account(client_id="svc-dup")
-    with pytest.raises(ServiceAccountAlreadyExistsError):
-        await service.create_service_account(data)
-
-@pytest.mark.asyncio
-async def test_create_service_account_hydra_failure(service, service_account_repo, hydra_client):
-    data = {"client_id": "svc-fail"}
-    service_account_repo.get_by_client_id.return_value = None
-    created = make_service_account(client_id="svc-fail")
-    service_account_repo.create.return_value = created
-    service_account_repo.get_by_id_with_roles.return_value = created
-    hydra_client.create_client.side_effect = Exception("hydra error")
-    service_account_repo.delete = AsyncMock()
-    with pytest.raises(HydraIntegrationError):
-        await service.create_service_account(data)
-    service_account_repo.delete.assert_called_once()
-
-@pytest.mark.asyncio
-async def test_get_service_account_success(service, service_account_repo):
+    hydra_client.create_client.side_effect = hydra_exc
+
+    with pytest.raises(expected_exc) if expected_exc else nullcontext():
+        result = await service.create_service_account({"client_id": client_id})
+
+    if expected_exc is None:
+        assert result.client_id == client_id
+    if exists:
+        hydra_client.create_client.assert_not_awaited()
+    else:
+        hydra_client.create_client.assert_awaited_once()
+    # A Hydra failure rolls back the database record
+    if hydra_exc:
+        service_account_repo.delete.assert_awaited_once()
+    else:
+        service_account_repo.delete.assert_not_awaited()
+
+async def test_get_service_account_success(service, make_service_account, service_account_repo):
     acc = make_service_account()
     service_account_repo.get_by_id.return_value = acc
     result = await service.get_service_account(acc.id)
     assert result is acc
 
-@pytest.mark.asyncio
-async def test_get_service_account_not_found(service, service_account_repo):
+async def test_get_service_account_not_found(service, next_uuid, service_account_repo):
     service_account_repo.get_by_id.return_value = None
     with pytest.raises(ServiceAccountNotFoundError):
-        await service.get_service_account(uuid4())
+        await service.get_service_account(next_uuid())
 
-@pytest.mark.asyncio
-async def test_update_service_account_success(service, service_account_repo, hydra_client):
+async def test_update_service_account_success(service, make_service_account, service_account_repo, hydra_client):
     acc = make_service_account()
     service_account_repo.get_by_id.return_value = acc
     updated = make_service_account(client_id=acc.client_id)
@@ -111,76 +67,62 @@ async def test_update_service_account_success(service, service_account_repo, hyd
     hydra_client.update_client.return_value = None
     result = await service.update_service_account(acc.id, {"foo": "bar"})
     assert result.client_id == acc.client_id
-    hydra_client.update_client.assert_called_once()
+    hydra_client.update_client.assert_awaited_once()
 
-@pytest.mark.asyncio
-async def test_delete_service_account_success(service, service_account_repo, hydra_client):
+async def test_delete_service_account_success(service, make_service_account, service_account_repo, hydra_client):
     acc = make_service_account()
     service_account_repo.get_by_id.return_value = acc
     hydra_client.delete_client.return_value = None
     service_account_repo.delete_service_account_with_roles_and_scopes.return_value = None
     await service.delete_service_account(acc.id)
-    hydra_client.delete_client.assert_called_once()
-    service_account_repo.delete_service_account_with_roles_and_scopes.assert_called_once()
+    hydra_client.delete_client.assert_awaited_once()
+    service_account_repo.delete_service_account_with_roles_and_scopes.assert_awaited_once()
 
-@pytest.mark.asyncio
-async def test_assign_role_to_service_account_success(service, service_account_repo, role_repo):
+async def test_assign_role_to_service_account_success(service, make_service_account, next_uuid,
+                                                      service_account_repo, role_repo):
     acc = make_service_account()
     role = MagicMock()
     service_account_repo.get_by_id.return_value = acc
     role_repo.get_by_id.return_value = role
     service_account_repo.assign_role.return_value = True
-    service_account_repo.get_by_id.return_value = acc
-    result = await service.assign_role_to_service_account(acc.id, uuid4())
-    assert result is acc
-
-@pytest.mark.asyncio
-async def test_remove_role_from_service_account_success(service, service_account_repo):
-    acc = make_service_account()
-    service_account_repo.get_by_id.return_value = acc
-    service_account_repo.remove_role.return_value = True
-    service_account_repo.get_by_id.return_value = acc
-    result = await service.remove_role_from_service_account(acc.id, uuid4())
+    result = await service.assign_role_to_service_account(acc.id, next_uuid())
     assert result is acc
 
-@pytest.mark.asyncio
-async def test_activate_service_account_success(service, service_account_repo):
-    acc = make_service_account()
-    service_account_repo.activate.return_value = True
-    service_account_repo.get_by_id.return_value = acc
-    result = await service.activate_service_account(acc.id)
-    assert result is acc
-
-@pytest.mark.asyncio
-async def test_deactivate_service_account_success(service, service_account_repo):
+@pytest.mark.parametrize(
+    "repo_attr, svc_attr, extra",
+    [
+        pytest.param("remove_role", "remove_role_from_service_account", (_ROLE_ID,), id="remove_role"),
+        pytest.param("activate", "activate_service_account", (), id="activate"),
+        pytest.param("deactivate", "deactivate_service_account", (), id="deactivate"),
+    ],
+)
+async def test_service_account_operation_success(service, make_service_account, service_account_repo,
+                                                 repo_attr, svc_attr, extra):
     acc = make_service_account()
-    service_account_repo.deactivate.return_value = True
+    getattr(service_account_repo, repo_attr).return_value = True
     service_account_repo.get_by_id.return_value = acc
-    result = await service.deactivate_service_account(acc.id)
+    result = await getattr(service, svc_attr)(acc.id, *extra)
     assert result is acc
 
-@pytest.mark.asyncio
-async def test_sync_with_hydra_success(service, service_account_repo, hydra_client):
+async def test_sync_with_hydra_success(service, make_service_account, service_account_repo, hydra_client):
     acc = make_service_account()
     service_account_repo.get_by_id.return_value = acc
     hydra_client.get_client.return_value = {"client_id": acc.client_id}
     hydra_client.update_client.return_value = None
     result = await service.sync_with_hydra(acc.id)
     assert result is acc
-    hydra_client.update_client.assert_called_once()
+    hydra_client.update_client.assert_awaited_once()
 
-@pytest.mark.asyncio
-async def test_sync_with_hydra_create_if_missing(service, service_account_repo, hydra_client):
+async def test_sync_with_hydra_create_if_missing(service, make_service_account, service_account_repo, hydra_client):
     acc = make_service_account()
     service_account_repo.get_by_id.return_value = acc
     hydra_client.get_client.return_value = None
     hydra_client.create_client.return_value = None
     result = await service.sync_with_hydra(acc.id)
     assert result is acc
-    hydra_client.create_client.assert_called_once()
+    hydra_client.create_client.assert_awaited_once()
 
-@pytest.mark.asyncio
-async def test_sync_with_hydra_failure(service, service_account_repo, hydra_client):
+async def test_sync_with_hydra_failure(service, make_service_account, service_account_repo, hydra_client):
     acc = make_service_account()
     service_account_repo.get_by_id.return_value = acc
     hydra_client.get_client.side_effect = Exception("hydra error")
@@ -4,317 +4,326 @@ Unit tests for UserService.
 Tests user management functionality including CRUD operations,
 role assignments, password management, and audit logging.
 """
+import re
+import string
+
 import pytest
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, call, patch
 from datetime import datetime
-from uuid import uuid4
+from uuid import UUID
 
+from src.services import auth_service as auth_service_module
+from src.services.auth_service import AuthService
 from src.services.user_service import UserService
 from src.models.user import User
 from src.models.role import Role
 from src.schemas.user import UserCreate, UserUpdate, UserPasswordReset
 
 
-class TestUserService:
-    """Test suite for UserService operations."""
+# Deterministic timestamps and IDs for the sample models
+_FIXED_NOW = datetime(2024, 1, 1)
+_FIXED_USER_ID = UUID("00000000-0000-0000-0000-000000000001")
+_FIXED_ROLE_ID = UUID("00000000-0000-0000-0000-000000000002")
+_FIXED_OTHER_ROLE_ID = UUID("00000000-0000-0000-0000-000000000003")
+
+# Characters _generate_service_password may draw from
+_SERVICE_PASSWORD_ALPHABET = frozenset(string.ascii_letters + string.digits + "!@#$%^&*")
+
+_USER_EXISTS_RE = re.compile(r"User with email .* already exists")
+
+# Schema inputs are immutable, so validate them once at import
+_SAMPLE_USER_CREATE = UserCreate(
+    email="new@example.com",
+    password="secure_password",
+    display_name="New User",
+    is_active=True
+)
+_SAMPLE_USER_UPDATE = UserUpdate(
+    email="updated@example.com",
+    display_name="Updated User",
+    is_active=False,
+    role_ids=["role-1", "role-2"]
+)
+
+
+@pytest.fixture(scope="session")
+def user_service(user_repo, role_repo, audit_repo):
+    """Create UserService instance with mocked dependencies."""
+    return UserService(user_repo, role_repo, audit_repo)
+
+
+@pytest.fixture
+def log_action_mock(user_service, monkeypatch):
+    """Replace the service's audit logging with an AsyncMock for this test."""
+    mock = AsyncMock()
+    monkeypatch.setattr(user_service, "_log_action", mock)
+    return mock
+
+
+@pytest.fixture(autouse=True)
+def mock_auth_service(user_service, monkeypatch):
+    """Replace the service's password hasher so no test pays for a real Argon2 hash."""
+    mock = MagicMock(spec_set=AuthService)
+    mock.hash_password_async.return_value = "hashed_password"
+    monkeypatch.setattr(user_service, "auth_service", mock)
+    return mock
+
+
+@pytest.fixture(scope="session")
+def sample_user_bare():
+    """Create sample User model without any roles."""
+    return User(
+        id=_FIXED_USER_ID,
+        email="test@example.com",
+        display_name="Test User",
+        password_hash="hashed_password",
+        is_active=True,
+        failed_login_attempts=0,
+        last_login_at=None,
+        locked_until=None,
+        social_provider=None,
+        created_at=_FIXED_NOW,
+        updated_at=_FIXED_NOW,
+        roles=[]
+    )
+
+
+@pytest.fixture(scope="session")
+def sample_user_with_role():
+    """Create sample User model with one assigned role."""
+    role = Role(
+        id=_FIXED_ROLE_ID,
+        name="admin",
+        description="Administrator role",
+        created_at=_FIXED_NOW,
+        updated_at=_FIXED_NOW
+    )
+    return User(
+        id=_FIXED_USER_ID,
+        email="test@example.com",
+        display_name="Test User",
+        password_hash="hashed_password",
+        is_active=True,
+        failed_login_attempts=0,
+        last_login_at=None,
+        locked_until=None,
+        social_provider=None,
+        created_at=_FIXED_NOW,
+        updated_at=_FIXED_NOW,
+        roles=[role]
+    )
+
+
+@pytest.fixture(scope="session")
+def sample_user_create():
+    """Create sample UserCreate schema."""
+    return _SAMPLE_USER_CREATE
+
+
+@pytest.fixture(scope="session")
+def sample_user_update():
+    """Create sample UserUpdate schema."""
+    return _SAMPLE_USER_UPDATE
 
-    @pytest.fixture
-    def mock_user_repo(self):
-        """Create mock UserRepository."""
-        return AsyncMock()
-
-    @pytest.fixture
-    def mock_role_repo(self):
-        """Create mock RoleRepository."""
-        return AsyncMock()
-
-    @pytest.fixture
-    def mock_audit_repo(self):
-        """Create mock AuditLogRepository."""
-        return AsyncMock()
-
-    @pytest.fixture
-    def user_service(self, mock_user_repo, mock_role_repo, mock_audit_repo):
-        """Create UserService instance with mocked dependencies."""
-        return UserService(mock_user_repo, mock_role_repo, mock_audit_repo)
-
-    @pytest.fixture
-    def sample_user(self):
-        """Create sample User model."""
-        user_id = uuid4()
-        role_id = uuid4()
-        role = Role(
-            id=role_id,
-            name="admin",
-            description="Administrator role",
-            created_at=datetime.utcnow(),
-            updated_at=datetime.utcnow()
-        )
-        return User(
-            id=user_id,
-            email="test@example.com",
-            display_name="Test User",
-            password_hash="hashed_password",
-            is_active=True,
-            failed_login_attempts=0,
-            last_login_at=None,
-            locked_until=None,
-            social_provider=None,
-            created_at=datetime.utcnow(),
-            updated_at=datetime.utcnow(),
-            roles=[role]
-        )
 
-    @pytest.fixture
-    def sample_user_create(self):
-        """Create sample UserCreate schema."""
-        return UserCreate(
-            email="new@example.com",
-            password="secure_password",
-            display_name="New User",
-            is_active=True
-        )
-
-    @pytest.fixture
-    def sample_user_update(self):
-        """Create sample UserUpdate schema."""
-        return UserUpdate(
-            email="updated@example.com",
-            display_name="Updated User",
-            is_active=False,
-            role_ids=["role-1", "role-2"]
-        )
+class TestUserService:
+    """Test suite for UserService operations."""
 
-    async def test_get_users_success(self, user_service, mock_user_repo, sample_user):
+    async def test_get_users_success(self, user_service, user_repo, sample_user_with_role):
         """Test successful retrieval of all users."""
-        mock_user_repo.get_all_with_roles.return_value = [sample_user]
+        user_repo.get_all_with_roles.return_value = [sample_user_with_role]
         
         result = await user_service.get_users(skip=0, limit=100)
         
-        mock_user_repo.get_all_with_roles.assert_called_once_with(0, 100)
+        assert user_repo.get_all_with_roles.call_args_list == [call(0, 100)]
         assert len(result) == 1
         assert result[0].email == "test@example.com"
         assert result[0].display_name == "Test User"
 
-    async def test_get_all_users_empty(self, user_service, mock_user_repo):
+    async def test_get_all_users_empty(self, user_service, user_repo):
         """Test retrieval when no users exist."""
-        mock_user_repo.get_all_with_roles.return_value = []
+        user_repo.get_all_with_roles.return_value = []
         
         result = await user_service.get_users()
         
         assert result == []
 
-    async def test_get_user_by_id_success(self, user_service, mock_user_repo, sample_user):
-        """Test successful user retrieval by ID."""
-        user_id = str(sample_user.id)
-        mock_user_repo.get_by_id_with_roles.return_value = sample_user
+    @pytest.mark.parametrize(
+        "user_found",
+        [pytest.param(True, id="success"), pytest.param(False, id="not_found")],
+    )
+    async def test_get_user_by_id(self, user_service, user_repo, sample_user_with_role, user_found):
+        """Test user retrieval by ID when the user exists and when it does not."""
+        user_id = str(sample_user_with_role.id)
+        user_repo.get_by_id_with_roles.return_value = sample_user_with_role if user_found else None
         
         result = await user_service.get_user_by_id(user_id)
         
-        mock_user_repo.get_by_id_with_roles.assert_called_once_with(user_id)
-        assert result is not None
-        assert result.email == "test@example.com"
+        assert user_repo.get_by_id_with_roles.call_args_list == [call(user_id)]
+        if user_found:
+            assert result is not None
+            assert result.email == "test@example.com"
+        else:
+            assert result is None
 
-    async def test_get_user_by_id_not_found(self, user_service, mock_user_repo):
-        """Test user retrieval when user not found."""
-        mock_user_repo.get_by_id_with_roles.return_value = None
-        
-        result = await user_service.get_user_by_id("nonexistent-id")
-        
-        assert result is None
-
-    @patch('src.services.user_service.ph')
-    async def test_create_user_success(self, mock_ph, user_service, mock_user_repo, 
-                                      sample_user_create, sample_user):
+    async def test_create_user_success(self, mock_auth_service, user_service, user_repo, 
+                                      sample_user_create, sample_user_bare):
         """Test successful user creation."""
-        mock_user_repo.get_by_email.return_value = None
-        mock_user_repo.create.return_value = sample_user
-        mock_user_repo.get_by_id_with_roles.return_value = sample_user
-        mock_ph.hash.return_value = "hashed_password"
+        user_repo.get_by_email.return_value = None
+        user_repo.create.return_value = sample_user_bare
+        user_repo.get_by_id_with_roles.return_value = sample_user_bare
         
         result = await user_service.create_user(sample_user_create, "admin")
         
-        mock_user_repo.get_by_email.assert_called_once_with(sample_user_create.email)
-        mock_ph.hash.assert_called_once_with(sample_user_create.password)
-        mock_user_repo.create.assert_called_once()
-        assert result.email == sample_user.email
+        assert user_repo.get_by_email.call_args_list == [call(sample_user_create.email)]
+        assert mock_auth_service.hash_password_async.call_args_list == [call(sample_user_create.password)]
+        assert user_repo.create.call_count == 1
+        assert result.email == sample_user_bare.email
 
-    async def test_create_user_already_exists(self, user_service, mock_user_repo, 
-                                            sample_user_create, sample_user):
+    async def test_create_user_already_exists(self, user_service, user_repo, 
+                                            sample_user_create, sample_user_bare):
         """Test user creation when email already exists."""
-        mock_user_repo.get_by_email.return_value = sample_user
+        user_repo.get_by_email.return_value = sample_user_bare
         
-        with pytest.raises(ValueError, match="User with email .* already exists"):
+        with pytest.raises(ValueError, match=_USER_EXISTS_RE):
             await user_service.create_user(sample_user_create, "admin")
 
-    async def test_update_user_success(self, user_service, mock_user_repo, mock_audit_repo,
-                                     sample_user, sample_user_update):
+    async def test_update_user_success(self, user_service, user_repo, audit_repo,
+                                     sample_user_with_role, sample_user_update):
         """Test successful user update."""
-        user_id = str(sample_user.id)
+        user_id = str(sample_user_with_role.id)
         # First call for checking if user exists, second call for role update, third for final fetch
-        mock_user_repo.get_by_id_with_roles.side_effect = [sample_user, sample_user, sample_user]
-        mock_user_repo.update.return_value = sample_user
+        user_repo.get_by_id_with_roles.side_effect = [sample_user_with_role] * 3
+        user_repo.update.return_value = sample_user_with_role
         
         result = await user_service.update_user(user_id, sample_user_update, "admin")
         
-        mock_user_repo.update.assert_called_once()
+        assert user_repo.update.call_count == 1
         # Should have multiple audit calls for role changes plus main update
-        assert mock_audit_repo.create_with_serialization.call_count >= 1
-        assert result.email == sample_user.email
+        assert audit_repo.create_with_serialization.call_count >= 1
+        assert result.email == sample_user_with_role.email
 
-    async def test_update_user_not_found(self, user_service, mock_user_repo, sample_user_update):
+    async def test_update_user_not_found(self, user_service, user_repo, sample_user_update):
         """Test user update when user not found."""
-        mock_user_repo.get_by_id_with_roles.return_value = None
+        user_repo.get_by_id_with_roles.return_value = None
         
         result = await user_service.update_user("nonexistent-id", sample_user_update, "admin")
         
         assert result is None
 
-    @patch('src.services.user_service.ph')
-    async def test_update_user_with_password(self, mock_ph, user_service, mock_user_repo, 
-                                           mock_audit_repo, sample_user):
+    async def test_update_user_with_password(self, mock_auth_service, user_service, user_repo, 
+                                           audit_repo, sample_user_bare):
         """Test user update with password change."""
-        user_id = str(sample_user.id)
+        user_id = str(sample_user_bare.id)
         update_data = UserUpdate(password="new_password")
-        mock_user_repo.get_by_id_with_roles.side_effect = [sample_user, sample_user]
-        mock_user_repo.update.return_value = sample_user
-        mock_ph.hash.return_value = "new_hashed_password"
+        user_repo.get_by_id_with_roles.side_effect = [sample_user_bare, sample_user_bare]
+        user_repo.update.return_value = sample_user_bare
+        mock_auth_service.hash_password_async.return_value = "new_hashed_password"
         
         result = await user_service.update_user(user_id, update_data, "admin")
         
-        mock_ph.hash.assert_called_once_with("new_password")
+        assert mock_auth_service.hash_password_async.call_args_list == [call("new_password")]
         assert result is not None
 
-    async def test_delete_user_success(self, user_service, mock_user_repo, sample_user):
-        """Test successful user deletion."""
-        user_id = str(sample_user.id)
-        mock_user_repo.get_by_id_with_roles.return_value = sample_user
-        mock_user_repo.delete_user_with_roles.return_value = True
-        
-        with patch.object(user_service, '_log_action') as mock_log:
-            result = await user_service.delete_user(user_id, "admin")
-        
-        mock_user_repo.delete_user_with_roles.assert_called_once_with(user_id)
-        mock_log.assert_called_once()
-        assert result is True
-
-    async def test_delete_user_not_found(self, user_service, mock_user_repo):
-        """Test user deletion when user not found."""
-        mock_user_repo.get_by_id_with_roles.return_value = None
-        
-        result = await user_service.delete_user("nonexistent-id", "admin")
-        
-        assert result is False
-
-    async def test_delete_user_failure(self, user_service, mock_user_repo, sample_user):
-        """Test user deletion failure."""
-        user_id = str(sample_user.id)
-        mock_user_repo.get_by_id_with_roles.return_value = sample_user
-        mock_user_repo.delete_user_with_roles.return_value = False
+    @pytest.mark.parametrize(
+        "user_found, deleted, expected",
+        [
+            pytest.param(True, True, True, id="success"),
+            pytest.param(False, True, False, id="not_found"),
+            pytest.param(True, False, False, id="failure"),
+        ],
+    )
+    async def test_delete_user(self, user_service, log_action_mock, user_repo, sample_user_bare,
+                               user_found, deleted, expected):
+        """Test user deletion success, missing user, and repository failure."""
+        user_id = str(sample_user_bare.id)
+        user_repo.get_by_id_with_roles.return_value = sample_user_bare if user_found else None
+        user_repo.delete_user_with_roles.return_value = deleted
         
         result = await user_service.delete_user(user_id, "admin")
         
-        assert result is False
-
-    @patch('src.services.user_service.ph')
-    async def test_reset_user_password_success(self, mock_ph, user_service, mock_user_repo, sample_user):
-        """Test successful password reset."""
-        user_id = str(sample_user.id)
+        assert result is expected
+        # The deletion is audited before it is attempted
+        assert log_action_mock.called is user_found
+        if user_found:
+            assert user_repo.delete_user_with_roles.call_args_list == [call(user_id)]
+        else:
+            user_repo.delete_user_with_roles.assert_not_called()
+
+    @pytest.mark.parametrize(
+        "user_found, updated, expected",
+        [
+            pytest.param(True, True, True, id="success"),
+            pytest.param(False, True, False, id="user_not_found"),
+            pytest.param(True, False, False, id="failure"),
+        ],
+    )
+    async def test_reset_user_password(self, mock_auth_service, user_service, user_repo, sample_user_bare,
+                                       user_found, updated, expected):
+        """Test password reset success, missing user, and repository failure."""
+        user_id = str(sample_user_bare.id)
         password_data = UserPasswordReset(new_password="new_secure_password")
-        mock_user_repo.get_by_id.return_value = sample_user
-        mock_user_repo.update_password.return_value = True
-        mock_ph.hash.return_value = "new_hashed_password"
+        user_repo.get_by_id.return_value = sample_user_bare if user_found else None
+        user_repo.update_password.return_value = updated
+        mock_auth_service.hash_password_async.return_value = "new_hashed_password"
         
         result = await user_service.reset_user_password(user_id, password_data, "admin")
         
-        mock_ph.hash.assert_called_once_with("new_secure_password")
-        mock_user_repo.update_password.assert_called_once_with(user_id, "new_hashed_password")
-        assert result is True
-
-    async def test_reset_user_password_user_not_found(self, user_service, mock_user_repo):
-        """Test password reset when user not found."""
-        password_data = UserPasswordReset(new_password="new_password")
-        mock_user_repo.get_by_id.return_value = None
-        
-        result = await user_service.reset_user_password("nonexistent-id", password_data, "admin")
-        
-        assert result is False
-
-    async def test_reset_user_password_failure(self, user_service, mock_user_repo, sample_user):
-        """Test password reset failure."""
-        user_id = str(sample_user.id)
-        password_data = UserPasswordReset(new_password="new_password")
-        mock_user_repo.get_by_id.return_value = sample_user
-        mock_user_repo.update_password.return_value = False
-        
-        with patch('src.services.user_service.ph'):
-            result = await user_service.reset_user_password(user_id, password_data, "admin")
-        
-        assert result is False
-
-    async def test_assign_role_to_user_success(self, user_service, mock_user_repo, 
-                                             mock_role_repo, sample_user):
-        """Test successful role assignment."""
-        user_id = str(sample_user.id)
+        assert result is expected
+        if user_found:
+            assert mock_auth_service.hash_password_async.call_args_list == [call("new_secure_password")]
+            assert user_repo.update_password.call_args_list == [call(user_id, "new_hashed_password")]
+        else:
+            user_repo.update_password.assert_not_called()
+
+    @pytest.mark.parametrize(
+        "assigned",
+        [pytest.param(True, id="success"), pytest.param(False, id="failure")],
+    )
+    async def test_assign_role_to_user(self, user_service, user_repo, role_repo, sample_user_bare, assigned):
+        """Test role assignment success and failure."""
+        user_id = str(sample_user_bare.id)
         role_id = "role-123"
-        role = Role(id=uuid4(), name="admin", description="Admin role", 
-                   created_at=datetime.utcnow(), updated_at=datetime.utcnow())
+        role = Role(id=_FIXED_OTHER_ROLE_ID, name="admin", description="Admin role", 
+                   created_at=_FIXED_NOW, updated_at=_FIXED_NOW)
         
-        mock_user_repo.assign_role.return_value = True
-        mock_user_repo.get_by_id.return_value = sample_user
-        mock_role_repo.get_by_id.return_value = role
+        user_repo.assign_role.return_value = assigned
+        user_repo.get_by_id.return_value = sample_user_bare
+        role_repo.get_by_id.return_value = role
         
         result = await user_service.assign_role_to_user(user_id, role_id, "admin")
         
-        mock_user_repo.assign_role.assert_called_once_with(user_id, role_id)
-        assert result is True
-
-    async def test_assign_role_to_user_failure(self, user_service, mock_user_repo):
-        """Test role assignment failure."""
-        mock_user_repo.assign_role.return_value = False
-        
-        result = await user_service.assign_role_to_user("user-id", "role-id", "admin")
-        
-        assert result is False
-
-    async def test_remove_role_from_user_success(self, user_service, mock_user_repo, 
-                                               mock_role_repo, sample_user):
-        """Test successful role removal."""
-        user_id = str(sample_user.id)
-        role_id = "role-123"
-        role = Role(id=uuid4(), name="admin", description="Admin role",
-                   created_at=datetime.utcnow(), updated_at=datetime.utcnow())
-        
-        mock_user_repo.get_by_id.return_value = sample_user
-        mock_role_repo.get_by_id.return_value = role
-        mock_user_repo.remove_role.return_value = True
-        
-        result = await user_service.remove_role_from_user(user_id, role_id, "admin")
-        
-        mock_user_repo.remove_role.assert_called_once_with(user_id, role_id)
-        assert result is True
-
-    async def test_remove_role_from_user_failure(self, user_service, mock_user_repo,
-                                               mock_role_repo, sample_user):
-        """Test role removal failure."""
-        user_id = str(sample_user.id)
+        assert user_repo.assign_role.call_args_list == [call(user_id, role_id)]
+        assert result is assigned
+
+    @pytest.mark.parametrize(
+        "role_found, removed",
+        [pytest.param(True, True, id="success"), pytest.param(False, False, id="failure")],
+    )
+    async def test_remove_role_from_user(self, user_service, user_repo, role_repo, sample_user_bare,
+                                         role_found, removed):
+        """Test role removal success and failure."""
+        user_id = str(sample_user_bare.id)
         role_id = "role-123"
+        role = Role(id=_FIXED_OTHER_ROLE_ID, name="admin", description="Admin role",
+                   created_at=_FIXED_NOW, updated_at=_FIXED_NOW)
         
-        mock_user_repo.get_by_id.return_value = sample_user
-        mock_role_repo.get_by_id.return_value = None
-        mock_user_repo.remove_role.return_value = False
+        user_repo.get_by_id.return_value = sample_user_bare
+        role_repo.get_by_id.return_value = role if role_found else None
+        user_repo.remove_role.return_value = removed
         
         result = await user_service.remove_role_from_user(user_id, role_id, "admin")
         
-        assert result is False
+        assert user_repo.remove_role.call_args_list == [call(user_id, role_id)]
+        assert result is removed
 
-    def test_user_to_response_conversion(self, user_service, sample_user):
+    def test_user_to_response_conversion(self, user_service, sample_user_with_role):
         """Test user model to response schema conversion."""
-        result = user_service._user_to_response(sample_user)
+        result = user_service._user_to_response(sample_user_with_role)
         
-        assert result.email == sample_user.email
-        assert result.display_name == sample_user.display_name
-        assert result.is_active == sample_user.is_active
+        assert result.email == sample_user_with_role.email
+        assert result.display_name == sample_user_with_role.display_name
+        assert result.is_active == sample_user_with_role.is_active
         assert len(result.roles) == 1
         assert result.roles[0].name == "admin"
 
@@ -323,38 +332,38 @@ class TestUserService:
         password = user_service._generate_service_password()
         
         assert len(password) == 24
-        assert all(c.isalnum() or c in "!@#$%^&*" for c in password)
+        assert not set(password) - _SERVICE_PASSWORD_ALPHABET
 
-    async def test_update_user_roles_add_and_remove(self, user_service, mock_user_repo, sample_user):
+    async def test_update_user_roles_add_and_remove(self, user_service, user_repo, sample_user_with_role):
         """Test updating user roles with additions and removals."""
-        user_id = str(sample_user.id)
+        user_id = str(sample_user_with_role.id)
         new_role_ids = ["role-2", "role-3"]  # Remove existing role-1, add role-2 and role-3
         
-        # Current user has role with ID from sample_user
-        current_role_id = str(sample_user.roles[0].id)
-        mock_user_repo.get_by_id_with_roles.return_value = sample_user
+        # Current user has role with ID from sample_user_with_role
+        current_role_id = str(sample_user_with_role.roles[0].id)
+        user_repo.get_by_id_with_roles.return_value = sample_user_with_role
         
         await user_service._update_user_roles(user_id, new_role_ids, "admin")
         
         # Should remove current role
-        mock_user_repo.remove_role.assert_called_once_with(user_id, current_role_id)
+        assert user_repo.remove_role.call_args_list == [call(user_id, current_role_id)]
         # Should add new roles
-        assert mock_user_repo.assign_role.call_count == 2
-        mock_user_repo.assign_role.assert_any_call(user_id, "role-2")
-        mock_user_repo.assign_role.assert_any_call(user_id, "role-3")
+        assert user_repo.assign_role.call_count == 2
+        user_repo.assign_role.assert_any_call(user_id, "role-2")
+        user_repo.assign_role.assert_any_call(user_id, "role-3")
 
-    async def test_update_user_roles_user_not_found(self, user_service, mock_user_repo):
+    async def test_update_user_roles_user_not_found(self, user_service, user_repo):
         """Test updating roles when user not found."""
-        mock_user_repo.get_by_id_with_roles.return_value = None
+        user_repo.get_by_id_with_roles.return_value = None
         
         # Should handle gracefully without throwing exception
         await user_service._update_user_roles("nonexistent-id", ["role-1"], "admin")
         
         # Should not call any role assignment methods
-        mock_user_repo.remove_role.assert_not_called()
-        mock_user_repo.assign_role.assert_not_called()
+        user_repo.remove_role.assert_not_called()
+        user_repo.assign_role.assert_not_called()
 
-    async def test_log_action(self, user_service, mock_audit_repo):
+    async def test_log_action(self, user_service, audit_repo):
         """Test audit log action logging."""
         await user_service._log_action(
             action="test_action",
@@ -364,10 +373,48 @@ class TestUserService:
             performed_by="admin"
         )
         
-        mock_audit_repo.create_with_serialization.assert_called_once_with(
+        assert audit_repo.create_with_serialization.call_args_list == [call(
             action="test_action",
             resource_type="user",
             resource_id="user-123",
             details={"key": "value"},
             performed_by="admin"
-        )
+        )]
+
+    @pytest.mark.parametrize(
+        "verified, expected_update",
+        [
+            pytest.param(True, {"failed_login_attempts": 0}, id="success"),
+            pytest.param(False, {"failed_login_attempts": 1}, id="wrong_password"),
+        ],
+    )
+    async def test_authenticate_user(self, user_service, mock_auth_service, user_repo, sample_user_bare,
+                                     verified, expected_update):
+        """Test authentication verifies through the shared AuthService and tracks failed attempts."""
+        user_repo.get_by_email.return_value = sample_user_bare
+        mock_auth_service.verify_password_async.return_value = verified
+
+        result = await user_service.authenticate_user("test@example.com", "password")
+
+        assert result is (sample_user_bare if verified else None)
+        assert mock_auth_service.verify_password_async.call_args_list == [
+            call("password", sample_user_bare.password_hash)
+        ]
+        assert user_repo.update.call_count == 1
+        user, update_dict = user_repo.update.call_args.args
+        assert user is sample_user_bare
+        assert update_dict.items() >= expected_update.items()
+
+    async def test_authenticate_user_unknown_email_runs_dummy_verify(self, user_repo, role_repo,
+                                                                     audit_repo):
+        """Test that an unknown email still pays for a dummy Argon2 verify so timing does not leak existence."""
+        service = UserService(user_repo, role_repo, audit_repo, auth_service=AuthService())
+        user_repo.get_by_email.return_value = None
+
+        with patch.object(auth_service_module, "verify_secret", wraps=auth_service_module.verify_secret) as spy:
+            result = await service.authenticate_user("missing@example.com", "password")
+
+        assert result is None
+        assert spy.call_count == 1
+        assert spy.call_args.args[0] == auth_service_module._DUMMY_HASH
+        user_repo.update.assert_not_called()